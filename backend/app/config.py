@@ -1,92 +1,138 @@
 """
-Application configuration using Pydantic Settings.
+Application configuration loaded from environment variables.
 
 All environment variables are accessed through this config object.
 Never use os.getenv() directly in business logic.
-"""
-
-from typing import List
 
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+Settings is a frozen, slotted dataclass populated once at import time:
+attribute access is a single slot dereference instead of Pydantic's
+validation/``__getattr__`` machinery, which matters for settings read
+on request hot paths.
+"""
 
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 
-class Settings(BaseSettings):
-    """Application settings loaded from environment variables"""
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=True,
-        extra="ignore",
-    )
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Application settings loaded from environment variables."""
 
     # AIDP Configuration
-    AIDP_API_URL: str = Field(
-        default="https://api.aidp.store",
-        description="AIDP API base URL",
-    )
-    AIDP_API_KEY: str = Field(
-        default="your_api_key_here",
-        description="AIDP API authentication key",
-    )
-    AIDP_NETWORK_ID: str = Field(
-        default="mainnet",
-        description="AIDP network identifier",
-    )
+    AIDP_API_URL: str = "https://api.aidp.store"
+    AIDP_API_KEY: str = "your_api_key_here"
+    AIDP_NETWORK_ID: str = "mainnet"
 
     # Render Provider Configuration
-    USE_MOCK_AIDP: bool = Field(
-        default=True,
-        description="Use MockAIDPProvider (local Blender) instead of real AIDP API",
-    )
+    # Use MockAIDPProvider (local Blender) instead of real AIDP API
+    USE_MOCK_AIDP: bool = True
 
     # Application Configuration
-    ALLOWED_ORIGINS: List[str] = Field(
-        default=["http://localhost:5173", "https://proofrender.vercel.app"],
-        description="CORS allowed origins",
-    )
-    MAX_UPLOAD_SIZE: int = Field(
-        default=10485760,
-        description="Maximum file upload size in bytes (10MB)",
-    )
-    RATE_LIMIT_REQUESTS: int = Field(
-        default=5,
-        description="Number of requests allowed per window",
-    )
-    RATE_LIMIT_WINDOW: int = Field(
-        default=3600,
-        description="Rate limit time window in seconds",
+    ALLOWED_ORIGINS: tuple[str, ...] = (
+        "http://localhost:5173",
+        "https://proofrender.vercel.app",
     )
+    MAX_UPLOAD_SIZE: int = 10485760  # 10MB
+    RATE_LIMIT_REQUESTS: int = 5
+    RATE_LIMIT_WINDOW: int = 3600
 
     # Storage Configuration
-    STORAGE_PATH: str = Field(
-        default="/app/storage",
-        description="Path for file storage",
-    )
-    FILE_TTL_HOURS: int = Field(
-        default=24,
-        description="File time-to-live in hours",
-    )
+    STORAGE_PATH: str = "/app/storage"
+    FILE_TTL_HOURS: int = 24
+
+    # Delegate download file serving to nginx via X-Accel-Redirect.
+    # Requires a matching nginx location:
+    #   location /_internal_outputs/ { internal; alias /tmp/outputs/; sendfile on; }
+    USE_X_ACCEL: bool = False
 
     # Blender Configuration
-    BLENDER_BINARY: str = Field(
-        default="/usr/bin/blender",
-        description="Path to Blender executable",
-    )
-    RENDER_RESOLUTION: str = Field(
-        default="1024x1024",
-        description="Render output resolution",
-    )
-    RENDER_SAMPLES: int = Field(
-        default=128,
-        description="Cycles render samples",
-    )
-    RENDER_TIMEOUT: int = Field(
-        default=300,
-        description="Maximum render time in seconds",
+    BLENDER_BINARY: str = "/usr/bin/blender"
+    # Keep a pool of long-lived Blender processes instead of forking one
+    # per render (amortizes bpy/Cycles/GPU startup across jobs)
+    BLENDER_WORKER_POOL: bool = False
+    RENDER_RESOLUTION: str = "1024x1024"
+    RENDER_SAMPLES: int = 128
+    RENDER_TIMEOUT: int = 300
+
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+# Default values (slots=True turns class attributes into descriptors,
+# so defaults are only reachable through an instance)
+_DEFAULTS = Settings()
+
+
+def _read_env_file(env_path: Path) -> dict[str, str]:
+    """Parse simple KEY=VALUE lines from a .env file (comments ignored)."""
+    values: dict[str, str] = {}
+    try:
+        for line in env_path.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, _, value = line.partition("=")
+            values[key.strip()] = value.strip().strip("\"'")
+    except OSError:
+        pass
+    return values
+
+
+def _load() -> Settings:
+    """Build Settings from os.environ (with .env fallback), typed and frozen."""
+    env = _read_env_file(Path(".env"))
+    env.update(os.environ)
+
+    def get_str(key: str, default: str) -> str:
+        return env.get(key, default)
+
+    def get_int(key: str, default: int) -> int:
+        raw = env.get(key)
+        try:
+            return int(raw) if raw is not None else default
+        except ValueError:
+            return default
+
+    def get_bool(key: str, default: bool) -> bool:
+        raw = env.get(key)
+        if raw is None:
+            return default
+        return raw.strip().lower() in _TRUTHY
+
+    origins_raw = env.get("ALLOWED_ORIGINS")
+    if origins_raw:
+        origins = tuple(origin.strip() for origin in origins_raw.split(","))
+    else:
+        origins = _DEFAULTS.ALLOWED_ORIGINS
+
+    return Settings(
+        AIDP_API_URL=get_str("AIDP_API_URL", _DEFAULTS.AIDP_API_URL),
+        AIDP_API_KEY=get_str("AIDP_API_KEY", _DEFAULTS.AIDP_API_KEY),
+        AIDP_NETWORK_ID=get_str("AIDP_NETWORK_ID", _DEFAULTS.AIDP_NETWORK_ID),
+        USE_MOCK_AIDP=get_bool("USE_MOCK_AIDP", _DEFAULTS.USE_MOCK_AIDP),
+        USE_X_ACCEL=get_bool("USE_X_ACCEL", _DEFAULTS.USE_X_ACCEL),
+        ALLOWED_ORIGINS=origins,
+        MAX_UPLOAD_SIZE=get_int("MAX_UPLOAD_SIZE", _DEFAULTS.MAX_UPLOAD_SIZE),
+        RATE_LIMIT_REQUESTS=get_int("RATE_LIMIT_REQUESTS", _DEFAULTS.RATE_LIMIT_REQUESTS),
+        RATE_LIMIT_WINDOW=get_int("RATE_LIMIT_WINDOW", _DEFAULTS.RATE_LIMIT_WINDOW),
+        STORAGE_PATH=get_str("STORAGE_PATH", _DEFAULTS.STORAGE_PATH),
+        FILE_TTL_HOURS=get_int("FILE_TTL_HOURS", _DEFAULTS.FILE_TTL_HOURS),
+        BLENDER_BINARY=get_str("BLENDER_BINARY", _DEFAULTS.BLENDER_BINARY),
+        BLENDER_WORKER_POOL=get_bool(
+            "BLENDER_WORKER_POOL", _DEFAULTS.BLENDER_WORKER_POOL
+        ),
+        RENDER_RESOLUTION=get_str("RENDER_RESOLUTION", _DEFAULTS.RENDER_RESOLUTION),
+        RENDER_SAMPLES=get_int("RENDER_SAMPLES", _DEFAULTS.RENDER_SAMPLES),
+        RENDER_TIMEOUT=get_int("RENDER_TIMEOUT", _DEFAULTS.RENDER_TIMEOUT),
     )
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the cached Settings instance (constructed once per process)."""
+    return _load()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
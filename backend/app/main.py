@@ -4,16 +4,29 @@ AIDP Proof of Render API
 Main FastAPI application entry point.
 """
 
+import asyncio
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+try:
+    # Swap in uvloop before any event loop is created; ~2x faster than
+    # the default asyncio loop for ASGI workloads
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
-from app.middleware import ErrorHandlerMiddleware
+from app.middleware import BodySizeLimitMiddleware, CoreMiddleware
 from app.routes import download, presets, render, upload
 from app.services.cleanup_scheduler import start_cleanup_scheduler, stop_cleanup_scheduler
+from app.services.rate_limiter import upload_rate_limiter
 
 
 @asynccontextmanager
@@ -21,8 +34,10 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager for startup/shutdown events."""
     # Startup
     start_cleanup_scheduler()
+    rate_limit_sweeper = asyncio.create_task(upload_rate_limiter.evict_loop())
     yield
     # Shutdown
+    rate_limit_sweeper.cancel()
     stop_cleanup_scheduler()
 
 app = FastAPI(
@@ -32,19 +47,14 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS configuration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.ALLOWED_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Reject oversized request bodies before they are buffered
+app.add_middleware(BodySizeLimitMiddleware, max_size=settings.MAX_UPLOAD_SIZE)
 
-# Error handling middleware
-app.add_middleware(ErrorHandlerMiddleware)
+# CORS + error handling combined in a single ASGI layer
+app.add_middleware(CoreMiddleware, allowed_origins=settings.ALLOWED_ORIGINS)
 
 # Register routers
 app.include_router(presets.router, prefix="/api", tags=["Metadata"])
@@ -53,14 +63,29 @@ app.include_router(render.router, prefix="/api", tags=["Render"])
 app.include_router(download.router, prefix="/api", tags=["Download"])
 
 
-@app.get("/")
-async def root():
-    """Health check endpoint"""
-    return {
+# Precomputed response bytes for the health endpoints: these are hit by
+# deployment liveness probes every few seconds, so skip Pydantic/JSON
+# serialization entirely on each call.
+_ROOT_BYTES = orjson.dumps(
+    {
         "status": "ok",
         "service": "AIDP Proof of Render API",
         "version": "0.1.0",
     }
+)
+
+_HEALTH_PREFIX = b'{"status": "healthy", "version": "1.0.0", "timestamp": "'
+_HEALTH_SUFFIX = b'"}'
+
+# Timestamp cache with one-second granularity: collapses sub-second probe
+# storms into a single datetime format per second
+_last_ts: tuple[int, bytes] = (0, b"")
+
+
+@app.get("/")
+async def root():
+    """Health check endpoint"""
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 @app.get("/health")
@@ -71,8 +96,12 @@ async def health_check():
     Returns service health status for monitoring and deployment health checks.
     Used by Railway/Render.com for deployment verification.
     """
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "version": "1.0.0",
-    }
+    global _last_ts
+    now_s = int(time.time())
+    if now_s != _last_ts[0]:
+        timestamp = datetime.fromtimestamp(now_s, timezone.utc).isoformat()
+        _last_ts = (now_s, timestamp.encode("ascii"))
+    return Response(
+        content=_HEALTH_PREFIX + _last_ts[1] + _HEALTH_SUFFIX,
+        media_type="application/json",
+    )
@@ -1,7 +1,8 @@
 """FastAPI middleware for request/response processing."""
 
+from .body_size_limit import BodySizeLimitMiddleware
+from .core import CoreMiddleware
 from .error_handler import (
-    ErrorHandlerMiddleware,
     RenderError,
     AssetNotFoundError,
     InvalidPresetError,
@@ -14,7 +15,8 @@ from .error_handler import (
 )
 
 __all__ = [
-    "ErrorHandlerMiddleware",
+    "BodySizeLimitMiddleware",
+    "CoreMiddleware",
     "RenderError",
     "AssetNotFoundError",
     "InvalidPresetError",
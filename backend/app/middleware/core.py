@@ -0,0 +1,177 @@
+"""
+Core ASGI middleware combining CORS and error handling.
+
+One middleware layer instead of CORSMiddleware + ErrorHandlerMiddleware:
+each ASGI layer costs an extra coroutine frame and awaits per request,
+so the two scope inspections are merged into a single pass.
+"""
+
+import logging
+
+import orjson
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .error_handler import RenderError
+
+logger = logging.getLogger(__name__)
+
+# Health-check paths hit by Railway/Render liveness probes at high frequency.
+# These skip both the error wrapping and CORS header handling.
+_BYPASS_PATHS = frozenset({"/", "/health"})
+
+_ALL_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+_MAX_AGE = b"600"
+
+
+class CoreMiddleware:
+    """
+    Handles CORS (preflight + response headers) and exception-to-JSON
+    conversion in a single pure-ASGI layer.
+
+    Mirrors CORSMiddleware semantics for this app's configuration
+    (allow_credentials=True, allow_methods=*, allow_headers=*): the
+    origin is echoed back when it is in the allowed set.
+    """
+
+    def __init__(self, app: ASGIApp, allowed_origins: tuple[str, ...]):
+        self.app = app
+        self.allowed_origins = frozenset(
+            origin.encode("latin-1") for origin in allowed_origins
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Fast path for liveness probes: no CORS, no error wrapping
+        if scope["path"] in _BYPASS_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        # Same-origin and server-to-server traffic sends no Origin header;
+        # only scan for the preflight method header on OPTIONS requests.
+        origin = None
+        if scope["method"] == "OPTIONS":
+            request_method = None
+            for name, value in scope["headers"]:
+                if name == b"origin":
+                    origin = value
+                elif name == b"access-control-request-method":
+                    request_method = value
+            allowed_origin = origin if origin in self.allowed_origins else None
+
+            # CORS preflight: answer directly without invoking the app
+            if request_method is not None:
+                await self._send_preflight(scope, send, allowed_origin)
+                return
+        else:
+            for name, value in scope["headers"]:
+                if name == b"origin":
+                    origin = value
+                    break
+            allowed_origin = origin if origin in self.allowed_origins else None
+
+        response_started = False
+
+        async def send_wrapper(message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                if allowed_origin is not None:
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"access-control-allow-origin", allowed_origin),
+                        (b"access-control-allow-credentials", b"true"),
+                        (b"vary", b"Origin"),
+                    ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+
+        except RenderError as e:
+            logger.error(
+                "RenderError: %s",
+                e.message,
+                extra={"status_code": e.status_code, "details": e.details},
+            )
+            if response_started:
+                # Response already in flight - let the server abort the connection
+                raise
+            await self._send_body(send, e.status_code, e.response_body(), allowed_origin)
+
+        except Exception as e:
+            # Log full stack trace for unexpected errors
+            logger.exception("Unhandled exception: %s", e)
+            if response_started:
+                raise
+            await self._send_json(
+                send,
+                500,
+                {
+                    "error": "Internal server error",
+                    "message": str(e) if logger.isEnabledFor(logging.DEBUG) else None,
+                },
+                allowed_origin,
+            )
+
+    async def _send_preflight(
+        self, scope: Scope, send: Send, allowed_origin: bytes | None
+    ) -> None:
+        """Answer a CORS preflight request without invoking the app."""
+        if allowed_origin is None:
+            headers = [(b"content-type", b"text/plain"), (b"vary", b"Origin")]
+            status = 400
+            body = b"Disallowed CORS origin"
+        else:
+            requested_headers = b"*"
+            for name, value in scope["headers"]:
+                if name == b"access-control-request-headers":
+                    requested_headers = value
+                    break
+            headers = [
+                (b"access-control-allow-origin", allowed_origin),
+                (b"access-control-allow-methods", _ALL_METHODS),
+                (b"access-control-allow-headers", requested_headers),
+                (b"access-control-allow-credentials", b"true"),
+                (b"access-control-max-age", _MAX_AGE),
+                (b"vary", b"Origin"),
+            ]
+            status = 200
+            body = b"OK"
+
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    async def _send_json(
+        self,
+        send: Send,
+        status_code: int,
+        payload: dict,
+        allowed_origin: bytes | None,
+    ) -> None:
+        """Send a JSON error response directly via raw ASGI messages."""
+        await self._send_body(send, status_code, orjson.dumps(payload), allowed_origin)
+
+    async def _send_body(
+        self,
+        send: Send,
+        status_code: int,
+        body: bytes,
+        allowed_origin: bytes | None,
+    ) -> None:
+        """Send pre-serialized JSON bytes as the response."""
+        headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+        if allowed_origin is not None:
+            headers += [
+                (b"access-control-allow-origin", allowed_origin),
+                (b"access-control-allow-credentials", b"true"),
+                (b"vary", b"Origin"),
+            ]
+        await send(
+            {"type": "http.response.start", "status": status_code, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": body})
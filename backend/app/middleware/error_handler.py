@@ -1,16 +1,14 @@
 """
-Centralized error handling middleware for FastAPI.
+Render error hierarchy and error response formatting.
 
-Provides consistent error responses and logging for all API routes.
+Exceptions raised anywhere in the request path are converted to
+consistent JSON error responses by CoreMiddleware (see core.py).
 """
 
 import logging
-import traceback
 from typing import Any
 
-from fastapi import Request
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -18,12 +16,38 @@ logger = logging.getLogger(__name__)
 class RenderError(Exception):
     """Base exception for render-related errors."""
 
+    __slots__ = ("message", "status_code", "details", "_body_prefix")
+
     def __init__(self, message: str, status_code: int = 500, details: Any = None):
         self.message = message
         self.status_code = status_code
         self.details = details
+        # Pre-encode the static part of the JSON error body at raise time
+        # so the middleware only serializes the details dict per response
+        self._body_prefix = b'{"error":' + orjson.dumps(message) + b',"details":'
         super().__init__(message)
 
+    def response_body(self) -> bytes:
+        """Serialize this error to its JSON response body bytes."""
+        return self._body_prefix + orjson.dumps(self.details) + b"}"
+
+
+# Joined valid-preset string, computed once on first InvalidPresetError
+# rather than re-joining the (static) preset list per exception
+_valid_presets_str: str | None = None
+
+
+def _valid_presets_joined() -> str:
+    global _valid_presets_str
+    if _valid_presets_str is None:
+        try:
+            from render_engine.preset_loader import list_available_presets
+
+            _valid_presets_str = ", ".join(list_available_presets())
+        except Exception:
+            _valid_presets_str = "studio, sunset, dramatic"
+    return _valid_presets_str
+
 
 class AssetNotFoundError(RenderError):
     """Raised when asset file is not found."""
@@ -39,11 +63,12 @@ class AssetNotFoundError(RenderError):
 class InvalidPresetError(RenderError):
     """Raised when preset name is invalid."""
 
-    def __init__(self, preset: str, valid_presets: list[str]):
+    def __init__(self, preset: str, valid_presets: list[str] | None = None):
+        joined = ", ".join(valid_presets) if valid_presets else _valid_presets_joined()
         super().__init__(
-            message=f"Invalid preset '{preset}'. Valid presets: {', '.join(valid_presets)}",
+            message=f"Invalid preset '{preset}'. Valid presets: {joined}",
             status_code=400,
-            details={"preset": preset, "valid_presets": valid_presets},
+            details={"preset": preset, "valid_presets": joined.split(", ")},
         )
 
 
@@ -102,41 +127,6 @@ class ProviderUnavailableError(RenderError):
         )
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware that catches unhandled exceptions and returns consistent error responses.
-    """
-
-    async def dispatch(self, request: Request, call_next):
-        try:
-            response = await call_next(request)
-            return response
-
-        except RenderError as e:
-            logger.error(
-                f"RenderError: {e.message}",
-                extra={"status_code": e.status_code, "details": e.details},
-            )
-            return JSONResponse(
-                status_code=e.status_code,
-                content={
-                    "error": e.message,
-                    "details": e.details,
-                },
-            )
-
-        except Exception as e:
-            # Log full stack trace for unexpected errors
-            logger.exception(f"Unhandled exception: {str(e)}")
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "error": "Internal server error",
-                    "message": str(e) if logger.isEnabledFor(logging.DEBUG) else None,
-                },
-            )
-
-
 def format_error_response(
     status_code: int,
     message: str,
@@ -5,6 +5,7 @@ Validates uploaded file size without loading entire file into memory.
 """
 
 import logging
+import os
 
 from fastapi import HTTPException, UploadFile, status
 
@@ -30,21 +31,36 @@ async def validate_file_size(file: UploadFile) -> int:
     Raises:
         HTTPException: 413 if file exceeds MAX_FILE_SIZE (10MB)
     """
-    size = 0
-    chunk_size = 1024 * 1024  # 1MB chunks
-
-    # Read file in chunks to calculate total size
-    while chunk := await file.read(chunk_size):
-        size += len(chunk)
-        if size > MAX_FILE_SIZE:
-            logger.warning(f"File size exceeded: {size} bytes (max: {MAX_FILE_SIZE})")
+    # Fast path: Starlette populates file.size from the multipart headers
+    # when the client sends one. Trust it and skip the read entirely.
+    if file.size is not None:
+        if file.size > MAX_FILE_SIZE:
+            logger.warning(
+                "File size exceeded: %d bytes (max: %d)", file.size, MAX_FILE_SIZE
+            )
             raise HTTPException(
                 status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
                 detail="File size exceeds 10MB limit"
             )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("File size validation passed: %d bytes", file.size)
+        return file.size
+
+    # Fallback: size unknown. The body is already spooled by Starlette
+    # (BytesIO or SpooledTemporaryFile), so measure it with a seek/tell
+    # on the underlying file object instead of re-reading the bytes.
+    underlying = file.file
+    underlying.seek(0, os.SEEK_END)
+    size = underlying.tell()
+    underlying.seek(0)
 
-    # Reset file pointer to beginning for subsequent reads
-    await file.seek(0)
+    if size > MAX_FILE_SIZE:
+        logger.warning("File size exceeded: %d bytes (max: %d)", size, MAX_FILE_SIZE)
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="File size exceeds 10MB limit"
+        )
 
-    logger.info(f"File size validation passed: {size} bytes")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("File size validation passed: %d bytes", size)
     return size
@@ -5,82 +5,131 @@ Provides endpoints for listing and retrieving scene preset configurations.
 """
 
 import logging
-from fastapi import APIRouter, HTTPException
+import os
+from pathlib import Path
+from fastapi import APIRouter, HTTPException, Request, Response
 from typing import Any
 
+import render_engine.preset_loader as preset_loader
 from render_engine.preset_loader import load_preset, list_available_presets
-from app.models.scene_preset import (
-    ScenePreset,
-    PresetListResponse,
-    Vector3,
-    LightConfig,
-)
+from pydantic import TypeAdapter
+
+from app.models.scene_preset import ScenePreset, PresetListResponse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Presets are developer-authored and effectively immutable at runtime, so
+# the fully-built response is cached and only rebuilt if presets.yaml's
+# mtime changes (e.g. during local development).
+_PRESETS_FILE = os.path.join(os.path.dirname(preset_loader.__file__), "presets.yaml")
+_preset_cache: PresetListResponse | None = None
+_preset_msgpack: bytes | None = None
+_preset_names: frozenset[str] | None = None
+_preset_mtime: int = 0
+
+# Pre-validated snapshot written at container-build time by
+# scripts/build_preset_cache.py; when present, startup skips the
+# YAML parse + Pydantic validation pass entirely.
+PRESET_CACHE_FILE = Path(__file__).parent.parent / "data" / "presets.msgpack"
+
+
+def _load_preset_snapshot() -> PresetListResponse | None:
+    """Load the msgpack preset snapshot if one was built (dev mode: None)."""
+    try:
+        import msgpack
+
+        payload = PRESET_CACHE_FILE.read_bytes()
+    except (ImportError, OSError):
+        return None
+    try:
+        return PresetListResponse.model_validate(msgpack.unpackb(payload, raw=False))
+    except Exception:
+        logger.warning("Invalid preset snapshot at %s; falling back", PRESET_CACHE_FILE)
+        return None
 
-def _convert_preset_to_model(preset_dict: dict[str, Any]) -> ScenePreset:
+
+# Validates all presets (nested Vector3/LightConfig included) in a single
+# pydantic-core call instead of one Python-level __init__ per model
+_PRESETS_ADAPTER = TypeAdapter(list[ScenePreset])
+
+
+def _prepare_preset_dict(preset_dict: dict[str, Any]) -> dict[str, Any]:
     """
-    Convert preset dictionary from YAML to Pydantic model.
+    Prepare a raw YAML preset dict for batch validation.
+
+    Injects the (placeholder) thumbnail URL; field names in the YAML
+    already match the ScenePreset schema.
 
     Args:
         preset_dict: Raw preset data from YAML file
 
     Returns:
-        ScenePreset: Validated Pydantic model
+        dict: Preset data ready for ScenePreset validation
     """
-    # Convert camera position
-    camera_pos = Vector3(**preset_dict["cameraPosition"])
-    camera_rot = Vector3(**preset_dict["cameraRotation"])
-
-    # Convert lights
-    lights = []
-    for light_data in preset_dict["lights"]:
-        light = LightConfig(
-            type=light_data["type"],
-            position=(
-                Vector3(**light_data["position"]) if "position" in light_data else None
-            ),
-            rotation=(
-                Vector3(**light_data["rotation"]) if "rotation" in light_data else None
-            ),
-            energy=light_data["energy"],
-            color=light_data["color"],
-            size=light_data.get("size"),
-        )
-        lights.append(light)
-
-    # Generate thumbnail URL (placeholder for now)
-    thumbnail_url = f"/gallery/{preset_dict['name']}-preview.webp"
-
-    # Create ScenePreset model
-    return ScenePreset(
-        name=preset_dict["name"],
-        displayName=preset_dict["displayName"],
-        description=preset_dict["description"],
-        thumbnailUrl=thumbnail_url,
-        cameraPosition=camera_pos,
-        cameraRotation=camera_rot,
-        backgroundColor=preset_dict["backgroundColor"],
-        lights=lights,
-        samples=preset_dict.get("samples", 128),
-        colorTemperature=preset_dict.get("colorTemperature"),
-        estimatedRenderTime=preset_dict.get("estimatedRenderTime"),
-        recommendedFor=preset_dict.get("recommendedFor"),
-        shadowsEnabled=preset_dict.get("shadowsEnabled"),
-    )
+    return {
+        **preset_dict,
+        "thumbnailUrl": f"/gallery/{preset_dict['name']}-preview.webp",
+    }
+
+
+def _build_presets() -> PresetListResponse:
+    """Load every preset from YAML and build the validated response."""
+    preset_names = list_available_presets()
+    logger.info(f"Loading {len(preset_names)} presets")
+
+    preset_dicts = [_prepare_preset_dict(load_preset(name)) for name in preset_names]
+    presets = _PRESETS_ADAPTER.validate_python(preset_dicts)
+
+    logger.info(f"Successfully loaded {len(presets)} presets")
+    return PresetListResponse.model_construct(presets=presets)
+
+
+def get_cached_presets() -> PresetListResponse:
+    """Return the preset list, rebuilding only when presets.yaml changes."""
+    global _preset_cache, _preset_msgpack, _preset_names, _preset_mtime
+
+    mtime = os.stat(_PRESETS_FILE).st_mtime_ns
+    if _preset_cache is None or mtime != _preset_mtime:
+        _preset_cache = _load_preset_snapshot() or _build_presets()
+        _preset_msgpack = None
+        _preset_names = None
+        _preset_mtime = mtime
+    return _preset_cache
+
+
+def get_valid_preset_names() -> frozenset[str]:
+    """Return the set of valid preset names, cached per rebuild."""
+    global _preset_names
+
+    cache = get_cached_presets()
+    if _preset_names is None:
+        _preset_names = frozenset(preset.name for preset in cache.presets)
+    return _preset_names
+
+
+def _get_cached_presets_msgpack() -> bytes:
+    """Return the preset list packed as MessagePack, cached per rebuild."""
+    global _preset_msgpack
+
+    cache = get_cached_presets()
+    if _preset_msgpack is None:
+        import msgpack
+
+        _preset_msgpack = msgpack.packb(cache.model_dump(), use_bin_type=True)
+    return _preset_msgpack
 
 
 @router.get("/presets", response_model=PresetListResponse, tags=["Metadata"])
-async def get_presets() -> PresetListResponse:
+async def get_presets(request: Request) -> PresetListResponse:
     """
     Get list of available scene presets.
 
     Returns all configured scene presets with their camera, lighting,
     and environment settings. Used by frontend to populate preset
-    selection UI.
+    selection UI. Clients sending ``Accept: application/msgpack``
+    receive the same payload as MessagePack (pre-packed per rebuild).
 
     Returns:
         PresetListResponse: List of available presets
@@ -89,19 +138,12 @@ async def get_presets() -> PresetListResponse:
         HTTPException: 500 if preset loading fails
     """
     try:
-        # Get list of available preset names
-        preset_names = list_available_presets()
-        logger.info(f"Loading {len(preset_names)} presets")
-
-        # Load each preset and convert to Pydantic model
-        presets = []
-        for name in preset_names:
-            preset_dict = load_preset(name)
-            preset_model = _convert_preset_to_model(preset_dict)
-            presets.append(preset_model)
-
-        logger.info(f"Successfully loaded {len(presets)} presets")
-        return PresetListResponse(presets=presets)
+        if "application/msgpack" in request.headers.get("accept", ""):
+            return Response(
+                content=_get_cached_presets_msgpack(),
+                media_type="application/msgpack",
+            )
+        return get_cached_presets()
 
     except FileNotFoundError as e:
         logger.error(f"Preset file not found: {e}")
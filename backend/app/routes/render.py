@@ -6,63 +6,32 @@ GET /api/status/{job_id} for checking job status.
 """
 
 import asyncio
-import json
 import logging
-from pathlib import Path
+import os
 
+import orjson
 from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi.responses import StreamingResponse
 
 from app.models import RenderRequest, RenderResponse, StatusResponse
+from app.routes.presets import get_valid_preset_names
 from app.services import get_render_provider
+from app.services.job_metadata import job_metadata_store
 from app.services.render_task import execute_render_job
-from render_engine.preset_loader import list_available_presets
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Valid presets (loaded dynamically but cached for validation)
-VALID_PRESETS: list[str] = []
+_FALLBACK_PRESETS = frozenset({"studio", "sunset", "dramatic"})
 
 
-def _get_valid_presets() -> list[str]:
-    """Get list of valid preset names, caching result."""
-    global VALID_PRESETS
-    if not VALID_PRESETS:
-        try:
-            VALID_PRESETS = list_available_presets()
-        except Exception:
-            VALID_PRESETS = ["studio", "sunset", "dramatic"]
-    return VALID_PRESETS
-
-
-def _get_job_metadata(job_id: str) -> dict | None:
-    """Load job metadata from filesystem."""
-    metadata_path = Path(f"/tmp/jobs/{job_id}/metadata.json")
-    if not metadata_path.exists():
-        return None
-    try:
-        with open(metadata_path) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        return None
-
-
-def _update_job_metadata(job_id: str, **updates) -> bool:
-    """Update job metadata with given fields."""
-    metadata_path = Path(f"/tmp/jobs/{job_id}/metadata.json")
-    if not metadata_path.exists():
-        return False
+def _get_valid_presets() -> frozenset[str]:
+    """Get the set of valid preset names from the shared preset cache."""
     try:
-        with open(metadata_path) as f:
-            metadata = json.load(f)
-        metadata.update(updates)
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
-        return True
-    except (json.JSONDecodeError, OSError) as e:
-        logger.error(f"Failed to update metadata for {job_id}: {e}")
-        return False
+        return get_valid_preset_names()
+    except Exception:
+        return _FALLBACK_PRESETS
 
 
 @router.post(
@@ -112,7 +81,7 @@ async def submit_render(
     logger.info(f"Render submission received: job_id={job_id}, preset={preset}")
 
     # Validate job exists
-    metadata = _get_job_metadata(job_id)
+    metadata = await job_metadata_store.get(job_id)
     if metadata is None:
         logger.warning(f"Job not found: {job_id}")
         raise HTTPException(
@@ -126,12 +95,14 @@ async def submit_render(
         logger.warning(f"Invalid preset: {preset}")
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid preset '{preset}'. Valid presets: {', '.join(valid_presets)}",
+            detail=f"Invalid preset '{preset}'. Valid presets: {', '.join(sorted(valid_presets))}",
         )
 
-    # Verify asset file exists
-    asset_path = Path(f"/tmp/uploads/{job_id}/asset.gltf")
-    if not asset_path.exists():
+    # Verify asset file exists (single stat, no exists()+open TOCTOU pair)
+    asset_path = f"/tmp/uploads/{job_id}/asset.gltf"
+    try:
+        os.stat(asset_path)
+    except FileNotFoundError:
         logger.error(f"Asset file missing for job {job_id}")
         raise HTTPException(
             status_code=404,
@@ -145,12 +116,12 @@ async def submit_render(
         # Submit job to provider
         provider_job_id = await provider.submit_job(
             job_id=job_id,
-            asset_path=str(asset_path),
+            asset_path=asset_path,
             preset=preset,
         )
 
         # Update metadata with render job info
-        _update_job_metadata(
+        await job_metadata_store.update(
             job_id,
             status="queued",
             presetName=preset,
@@ -171,7 +142,7 @@ async def submit_render(
             provider=provider,
         )
 
-        return RenderResponse(
+        return RenderResponse.model_construct(
             job_id=job_id,
             status="queued",
             message="Render job submitted successfully",
@@ -240,7 +211,7 @@ async def get_job_status(job_id: str) -> StatusResponse:
     logger.info(f"Status request: job_id={job_id}")
 
     # Load job metadata
-    metadata = _get_job_metadata(job_id)
+    metadata = await job_metadata_store.get(job_id)
     if metadata is None:
         logger.warning(f"Job not found: {job_id}")
         raise HTTPException(
@@ -254,7 +225,7 @@ async def get_job_status(job_id: str) -> StatusResponse:
 
     # If no provider job ID, job hasn't been submitted for rendering yet
     if not provider_job_id:
-        return StatusResponse(
+        return StatusResponse.model_construct(
             job_id=job_id,
             status=metadata.get("status", "uploaded"),
             progress_percent=0,
@@ -264,19 +235,38 @@ async def get_job_status(job_id: str) -> StatusResponse:
             provider_job_id=None,
         )
 
+    # Terminal jobs can't change anymore: answer from cached metadata
+    # without touching the provider or disk
+    cached_status = metadata.get("status")
+    if cached_status in _TERMINAL_STATUSES:
+        return StatusResponse.model_construct(
+            job_id=job_id,
+            status=cached_status,
+            progress_percent=100 if cached_status != "failed" else 0,
+            estimated_time_remaining=0 if cached_status != "failed" else None,
+            error_message=metadata.get("error"),
+            provider=provider_name,
+            provider_job_id=provider_job_id,
+        )
+
     try:
         # Get live status from provider
         provider = get_render_provider()
         provider_status = await provider.get_status(provider_job_id)
 
-        # Update metadata with latest status
-        _update_job_metadata(
-            job_id,
-            status=provider_status["status"],
-            error=provider_status.get("error_message"),
-        )
-
-        return StatusResponse(
+        # Write back only on an actual transition; polls that observe
+        # no change cost no disk write
+        if (
+            provider_status["status"],
+            provider_status.get("error_message"),
+        ) != (metadata.get("status"), metadata.get("error")):
+            await job_metadata_store.update(
+                job_id,
+                status=provider_status["status"],
+                error=provider_status.get("error_message"),
+            )
+
+        return StatusResponse.model_construct(
             job_id=job_id,
             status=provider_status["status"],
             progress_percent=provider_status.get("progress_percent", 0),
@@ -289,7 +279,7 @@ async def get_job_status(job_id: str) -> StatusResponse:
     except KeyError:
         # Provider doesn't have this job - return metadata status
         logger.warning(f"Provider job not found: {provider_job_id}")
-        return StatusResponse(
+        return StatusResponse.model_construct(
             job_id=job_id,
             status=metadata.get("status", "unknown"),
             progress_percent=0,
@@ -312,3 +302,77 @@ async def get_job_status(job_id: str) -> StatusResponse:
             status_code=500,
             detail=f"Failed to get job status: {str(e)}",
         )
+
+
+# Terminal job states: the SSE stream closes once one is reached
+_TERMINAL_STATUSES = frozenset({"rendering_complete", "complete", "failed"})
+
+
+@router.get(
+    "/status/{job_id}/stream",
+    summary="Stream Job Status",
+    description="""
+Stream render job status updates as Server-Sent Events.
+
+Emits a `data: {...}` event whenever the job's status payload changes,
+then closes the connection once the job completes or fails. Replaces
+1-2s client polling with a single long-lived connection.
+""",
+    responses={
+        200: {"description": "SSE stream of status updates"},
+        404: {"description": "Job not found"},
+    },
+)
+async def stream_job_status(job_id: str) -> StreamingResponse:
+    """
+    Stream status updates for a render job over SSE.
+
+    Args:
+        job_id: Job ID from upload endpoint
+
+    Returns:
+        StreamingResponse emitting `data: {...}` events on status change
+
+    Raises:
+        HTTPException 404: If job_id not found
+    """
+    metadata = await job_metadata_store.get(job_id)
+    if metadata is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    async def event_stream():
+        last_payload = None
+        while True:
+            current = await job_metadata_store.get(job_id) or {}
+            provider_job_id = current.get("providerJobId")
+
+            payload = {
+                "jobId": job_id,
+                "status": current.get("status", "uploaded"),
+                "progressPercent": current.get("progressPercent", 0),
+                "errorMessage": current.get("error"),
+            }
+
+            if provider_job_id:
+                try:
+                    provider = get_render_provider()
+                    provider_status = await provider.get_status(provider_job_id)
+                    payload["status"] = provider_status["status"]
+                    payload["progressPercent"] = provider_status.get(
+                        "progress_percent", 0
+                    )
+                    payload["errorMessage"] = provider_status.get("error_message")
+                except (KeyError, NotImplementedError):
+                    pass
+
+            # Only push bytes when something actually changed
+            if payload != last_payload:
+                yield b"data: " + orjson.dumps(payload) + b"\n\n"
+                last_payload = payload
+
+            if payload["status"] in _TERMINAL_STATUSES:
+                break
+
+            await asyncio.sleep(0.5)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
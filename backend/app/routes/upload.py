@@ -12,7 +12,7 @@ from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
 from app.middleware.file_size_validator import validate_file_size
 from app.models.upload_response import UploadResponse
 from app.services.file_storage import FileStorageManager
-from app.services.file_validator import validate_gltf_format, validate_gltf_structure
+from app.services.file_validator import validate_gltf_format, validate_gltf_structure_async
 from app.services.rate_limiter import check_upload_rate_limit
 
 logger = logging.getLogger(__name__)
@@ -100,19 +100,19 @@ async def upload_asset(
         )
 
     try:
-        # Save uploaded file
-        file_path = await storage.save_upload(job_id, file)
-
-        # Validate .gltf structure (requires saved file)
-        validate_gltf_structure(file_path)
+        # Save uploaded file, validating .gltf structure from the bytes
+        # already streaming through the save (no second disk read)
+        file_path = await storage.save_upload(
+            job_id, file, validate=validate_gltf_structure_async
+        )
 
         # Create job metadata
-        storage.create_job_metadata(job_id, file.filename, file_size)
+        await storage.create_job_metadata(job_id, file.filename, file_size)
 
         logger.info(f"Upload successful for job {job_id}")
 
         # Return success response
-        return UploadResponse(
+        return UploadResponse.model_construct(
             jobId=job_id,
             message="Upload successful",
             assetFilename=file.filename,
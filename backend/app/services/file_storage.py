@@ -5,16 +5,26 @@ Manages temporary storage for uploads, renders, and proofs with filesystem opera
 Handles job metadata creation and retrieval.
 """
 
-import json
+import asyncio
+import inspect
 import logging
+import os
 from datetime import datetime, timezone
-from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
+import aiofiles
+import orjson
+from cachetools import TTLCache
 from fastapi import UploadFile
 
+from .cleanup_scheduler import register_job
+
 logger = logging.getLogger(__name__)
 
+# Streaming copy chunk size for upload saves: 1MiB keeps peak memory
+# bounded while needing at most ~10 iterations for the largest upload
+UPLOAD_CHUNK_SIZE = 1 << 20
+
 
 class FileStorageManager:
     """
@@ -33,20 +43,36 @@ class FileStorageManager:
         Args:
             base_path: Base directory for all storage operations (default: /tmp)
         """
-        self.base_path = Path(base_path)
-        self.uploads_path = self.base_path / "uploads"
-        self.jobs_path = self.base_path / "jobs"
-
-    async def save_upload(self, job_id: str, file: UploadFile) -> str:
+        # Raw string paths + os.* calls: pathlib's accessor layer and
+        # __truediv__ allocations are measurable on the upload hot path
+        self.base_path = base_path
+        self.uploads_path = os.path.join(base_path, "uploads")
+        self.jobs_path = os.path.join(base_path, "jobs")
+        # Short-TTL metadata cache: status pollers hitting the same job
+        # within the window pay zero disk I/O
+        self._meta_cache: TTLCache = TTLCache(maxsize=1024, ttl=2.0)
+
+    async def save_upload(
+        self,
+        job_id: str,
+        file: UploadFile,
+        validate: Optional[Callable[[bytes, str], None]] = None,
+    ) -> str:
         """
         Save uploaded file to storage with proper permissions.
 
         Creates directory structure: /tmp/uploads/{job_id}/asset.gltf
         Sets file permissions to 644 (read for all, write for owner)
 
+        When a validator is given, it runs against the bytes already in
+        flight through the save loop, so validation costs no second read
+        of the file from disk. Validation failure removes the file.
+
         Args:
             job_id: Unique job identifier (UUID v4)
             file: FastAPI UploadFile object containing the uploaded asset
+            validate: Optional (optionally async) callable(data, source)
+                raising on bad content
 
         Returns:
             str: Full path to saved file
@@ -55,36 +81,100 @@ class FileStorageManager:
             OSError: If directory creation or file write fails
         """
         # Create job-specific upload directory
-        job_upload_dir = self.uploads_path / job_id
-        job_upload_dir.mkdir(parents=True, exist_ok=True)
+        job_upload_dir = os.path.join(self.uploads_path, job_id)
+        os.makedirs(job_upload_dir, exist_ok=True)
 
         # Save file as asset.gltf
-        file_path = job_upload_dir / "asset.gltf"
+        file_path = os.path.join(job_upload_dir, "asset.gltf")
 
-        try:
-            # Read file content
-            content = await file.read()
+        buffer = bytearray() if validate is not None else None
 
-            # Write to disk
-            with open(file_path, "wb") as f:
-                f.write(content)
+        try:
+            if buffer is None and self._sendfile_copy_possible(file):
+                # Large spooled uploads with a real fd: copy inside the
+                # kernel, no Python-level buffers at all
+                await asyncio.to_thread(self._sendfile_copy, file, file_path)
+            else:
+                # Stream from the upload spool to disk in bounded chunks
+                # (uploads are capped at MAX_UPLOAD_SIZE by the middleware);
+                # the chunked path also feeds the in-flight validator buffer
+                async with aiofiles.open(file_path, "wb") as f:
+                    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                        if buffer is not None:
+                            buffer += chunk
+                        await f.write(chunk)
 
             # Set file permissions: 644 (rw-r--r--)
-            file_path.chmod(0o644)
-
-            logger.info(f"Saved upload for job {job_id} to {file_path}")
-            return str(file_path)
+            await asyncio.to_thread(os.chmod, file_path, 0o644)
 
         except Exception as e:
             logger.error(f"Failed to save upload for job {job_id}: {str(e)}")
             raise OSError(f"Failed to save uploaded file: {str(e)}")
 
-    def create_job_metadata(self, job_id: str, filename: str, file_size: int) -> str:
+        if validate is not None:
+            try:
+                result = validate(bytes(buffer), file_path)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                # Don't leave a rejected asset (or its job directory,
+                # which no cleanup index entry will ever cover) on disk
+                await asyncio.to_thread(self._discard_upload, file_path)
+                raise
+
+        logger.info(f"Saved upload for job {job_id} to {file_path}")
+        return file_path
+
+    @staticmethod
+    def _sendfile_copy_possible(file: UploadFile) -> bool:
+        """True when the upload spool is a real on-disk fd sendfile can read."""
+        if not hasattr(os, "sendfile"):
+            return False
+        try:
+            file.file.fileno()
+            return True
+        except (AttributeError, OSError, ValueError):
+            # In-memory spool (BytesIO) has no file descriptor
+            return False
+
+    @staticmethod
+    def _sendfile_copy(file: UploadFile, file_path: str) -> None:
+        """Copy the spooled upload to its destination inside the kernel."""
+        src = file.file
+        src.seek(0, os.SEEK_END)
+        size = src.tell()
+        src.seek(0)
+        src_fd = src.fileno()
+        with open(file_path, "wb") as dst:
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+
+    @staticmethod
+    def _discard_upload(file_path: str) -> None:
+        """Best-effort removal of a rejected asset and its job directory."""
+        try:
+            os.unlink(file_path)
+        except OSError:
+            pass
+        try:
+            os.rmdir(os.path.dirname(file_path))
+        except OSError:
+            pass
+
+    async def create_job_metadata(
+        self, job_id: str, filename: str, file_size: int
+    ) -> str:
         """
         Create job metadata JSON file with initial upload information.
 
         Creates directory structure: /tmp/jobs/{job_id}/metadata.json
         Metadata includes: job_id, upload_timestamp, filename, file_size, status
+        Disk operations run in a worker thread so concurrent requests
+        don't queue behind the write.
 
         Args:
             job_id: Unique job identifier (UUID v4)
@@ -98,8 +188,8 @@ class FileStorageManager:
             OSError: If directory creation or file write fails
         """
         # Create job-specific metadata directory
-        job_metadata_dir = self.jobs_path / job_id
-        job_metadata_dir.mkdir(parents=True, exist_ok=True)
+        job_metadata_dir = os.path.join(self.jobs_path, job_id)
+        await asyncio.to_thread(os.makedirs, job_metadata_dir, exist_ok=True)
 
         # Generate metadata
         metadata = {
@@ -117,24 +207,39 @@ class FileStorageManager:
             "error": None
         }
 
-        # Save metadata as JSON
-        metadata_path = job_metadata_dir / "metadata.json"
+        # Save metadata as JSON (write + atomic rename: a crash mid-write
+        # can't leave a truncated metadata.json behind)
+        metadata_path = os.path.join(job_metadata_dir, "metadata.json")
+
+        data = orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+
+        def _write_atomic() -> None:
+            tmp_path = f"{metadata_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, metadata_path)
 
         try:
-            with open(metadata_path, "w") as f:
-                json.dump(metadata, f, indent=2)
+            await asyncio.to_thread(_write_atomic)
+
+            # Register with the cleanup index so sweeps don't have to
+            # stat this job's folders
+            await asyncio.to_thread(register_job, job_id)
 
+            self.invalidate(job_id)
             logger.info(f"Created job metadata for job {job_id} at {metadata_path}")
-            return str(metadata_path)
+            return metadata_path
 
         except Exception as e:
             logger.error(f"Failed to create metadata for job {job_id}: {str(e)}")
             raise OSError(f"Failed to create job metadata: {str(e)}")
 
-    def get_job_metadata(self, job_id: str) -> Optional[dict]:
+    async def get_job_metadata(self, job_id: str) -> Optional[dict]:
         """
         Load and return job metadata if exists.
 
+        The read runs in a worker thread to keep the event loop free.
+
         Args:
             job_id: Unique job identifier (UUID v4)
 
@@ -143,22 +248,34 @@ class FileStorageManager:
 
         Handles JSON parsing errors gracefully by returning None
         """
-        metadata_path = self.jobs_path / job_id / "metadata.json"
+        cached = self._meta_cache.get(job_id)
+        if cached is not None:
+            return cached
 
-        if not metadata_path.exists():
-            logger.warning(f"Metadata not found for job {job_id}")
-            return None
+        metadata_path = os.path.join(self.jobs_path, job_id, "metadata.json")
+
+        def _read() -> bytes:
+            with open(metadata_path, "rb") as f:
+                return f.read()
 
         try:
-            with open(metadata_path, "r") as f:
-                metadata = json.load(f)
+            metadata = orjson.loads(await asyncio.to_thread(_read))
 
+            self._meta_cache[job_id] = metadata
             logger.info(f"Loaded metadata for job {job_id}")
             return metadata
 
-        except json.JSONDecodeError as e:
+        except FileNotFoundError:
+            logger.warning(f"Metadata not found for job {job_id}")
+            return None
+
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse metadata for job {job_id}: {str(e)}")
             return None
         except Exception as e:
             logger.error(f"Failed to read metadata for job {job_id}: {str(e)}")
             return None
+
+    def invalidate(self, job_id: str) -> None:
+        """Drop a job's cached metadata (call after any metadata write)."""
+        self._meta_cache.pop(job_id, None)
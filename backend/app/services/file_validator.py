@@ -4,13 +4,25 @@ File Validation Service
 Validates file format and structure for uploaded .gltf assets.
 """
 
+import asyncio
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
 
+import orjson
 from fastapi import HTTPException, UploadFile
-from pygltflib import GLTF2
 
 logger = logging.getLogger(__name__)
 
+# Accepted upload MIME types (with fallbacks for different clients):
+# model/gltf+json is the standard; browsers and generic clients may send
+# application/json, application/octet-stream, an empty value, or nothing
+_ACCEPTED_MIME: frozenset = frozenset(
+    {"model/gltf+json", "application/json", "application/octet-stream", "", None}
+)
+
 
 def validate_gltf_format(file: UploadFile) -> None:
     """
@@ -34,16 +46,8 @@ def validate_gltf_format(file: UploadFile) -> None:
             detail="Invalid file format. Only .gltf files are supported."
         )
 
-    # Check MIME type (with fallbacks for different clients)
-    accepted_mime_types = [
-        'model/gltf+json',      # Standard MIME type
-        'application/json',     # Fallback for some browsers
-        'application/octet-stream',  # Fallback for generic upload
-        '',                     # Empty MIME type from some clients
-        None                    # No MIME type set
-    ]
-
-    if file.content_type not in accepted_mime_types:
+    # Check MIME type against the precomputed allowlist
+    if file.content_type not in _ACCEPTED_MIME:
         logger.warning(
             f"Invalid MIME type: {file.content_type} for file {file.filename}"
         )
@@ -55,49 +59,142 @@ def validate_gltf_format(file: UploadFile) -> None:
     logger.info(f"File format validation passed for {file.filename}")
 
 
-def validate_gltf_structure(file_path: str) -> None:
+def validate_gltf_structure_bytes(data: bytes, source: str = "upload") -> None:
     """
-    Validate .gltf file structure using pygltflib.
+    Validate .gltf structure from in-memory bytes.
 
-    Verifies file is well-formed and contains valid scene data.
-    Requires file to be saved to disk first (pygltflib needs file path).
+    Called with the bytes already flowing through the upload save, so
+    the asset never needs to be read back from disk for validation.
 
     Args:
-        file_path: Absolute path to saved .gltf file
+        data: Raw .gltf JSON bytes
+        source: Label used in log messages (filename or path)
 
     Raises:
         HTTPException: 400 if file is corrupted or has invalid structure
     """
     try:
-        # Load .gltf file
-        gltf = GLTF2.load(file_path)
+        # .gltf is plain JSON: a targeted key check is all the structural
+        # validation needed here, without pygltflib materializing the full
+        # object model (meshes, accessors, materials...) for multi-MB assets
+        doc = orjson.loads(data)
+
+        scenes = doc.get("scenes") or []
+        nodes = doc.get("nodes") or []
 
         # Verify file contains valid scene data
-        if not gltf.scenes:
-            logger.error(f"GLTF validation failed: No scenes found in {file_path}")
+        if not scenes:
+            logger.error(f"GLTF validation failed: No scenes found in {source}")
             raise HTTPException(
                 status_code=400,
                 detail="Invalid .gltf file: No scenes found"
             )
 
-        if not gltf.nodes:
-            logger.error(f"GLTF validation failed: No nodes found in {file_path}")
+        if not nodes:
+            logger.error(f"GLTF validation failed: No nodes found in {source}")
             raise HTTPException(
                 status_code=400,
                 detail="Invalid .gltf file: No nodes found"
             )
 
         logger.info(
-            f"Valid .gltf structure: {len(gltf.scenes)} scenes, "
-            f"{len(gltf.nodes)} nodes"
+            f"Valid .gltf structure: {len(scenes)} scenes, "
+            f"{len(nodes)} nodes"
         )
 
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
     except Exception as e:
+        logger.error(f"GLTF structure validation failed for {source}: {str(e)}")
+        raise HTTPException(
+            status_code=400,
+            detail=f"Corrupted .gltf file: {str(e)}"
+        )
+
+
+def validate_gltf_structure(file_path: str) -> None:
+    """
+    Validate .gltf file structure from a saved file.
+
+    Args:
+        file_path: Absolute path to saved .gltf file
+
+    Raises:
+        HTTPException: 400 if file is corrupted or has invalid structure
+    """
+    try:
+        data = Path(file_path).read_bytes()
+    except OSError as e:
         logger.error(f"GLTF structure validation failed for {file_path}: {str(e)}")
         raise HTTPException(
             status_code=400,
             detail=f"Corrupted .gltf file: {str(e)}"
         )
+    validate_gltf_structure_bytes(data, source=file_path)
+
+
+# Assets above this size get parsed in a worker process so concurrent
+# uploads use multiple cores instead of serializing on the event loop
+_LARGE_GLTF_THRESHOLD = 2 * 1024 * 1024
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _process_pool
+
+
+def _count_structure_keys(data: bytes) -> tuple[int, int]:
+    """Parse glTF bytes and return (scene count, node count). Picklable."""
+    doc = orjson.loads(data)
+    return len(doc.get("scenes") or []), len(doc.get("nodes") or [])
+
+
+async def validate_gltf_structure_async(data: bytes, source: str = "upload") -> None:
+    """
+    Validate .gltf structure, offloading large parses to a process pool.
+
+    Small assets take the inline orjson path; larger ones are parsed in
+    a worker process to bypass the GIL under concurrent uploads.
+
+    Args:
+        data: Raw .gltf JSON bytes
+        source: Label used in log messages (filename or path)
+
+    Raises:
+        HTTPException: 400 if file is corrupted or has invalid structure
+    """
+    if len(data) < _LARGE_GLTF_THRESHOLD:
+        validate_gltf_structure_bytes(data, source)
+        return
+
+    loop = asyncio.get_running_loop()
+    try:
+        n_scenes, n_nodes = await loop.run_in_executor(
+            _get_process_pool(), _count_structure_keys, data
+        )
+    except Exception as e:
+        logger.error(f"GLTF structure validation failed for {source}: {str(e)}")
+        raise HTTPException(
+            status_code=400,
+            detail=f"Corrupted .gltf file: {str(e)}"
+        )
+
+    if not n_scenes:
+        logger.error(f"GLTF validation failed: No scenes found in {source}")
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid .gltf file: No scenes found"
+        )
+    if not n_nodes:
+        logger.error(f"GLTF validation failed: No nodes found in {source}")
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid .gltf file: No nodes found"
+        )
+
+    logger.info(f"Valid .gltf structure: {n_scenes} scenes, {n_nodes} nodes")
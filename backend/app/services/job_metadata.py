@@ -0,0 +1,126 @@
+"""
+Job Metadata Store Service
+
+Single source of truth for job metadata.json access. Replaces the
+per-route copies of _get_job_metadata/_update_job_metadata with one
+implementation that caches parsed metadata by file mtime, writes
+atomically (temp file + os.replace), and serializes writers with a
+per-job asyncio.Lock so a /status poll and the background render task
+cannot lose updates to each other.
+"""
+
+import asyncio
+import logging
+import os
+
+import orjson
+from cachetools import TTLCache
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Entries age out with the on-disk file TTL so the cache and lock maps
+# can't grow with total historical jobs
+_CACHE_MAXSIZE = 10_000
+
+
+class JobMetadataStore:
+    """
+    Cached, atomic accessor for /tmp/jobs/{job_id}/metadata.json.
+
+    Reads cost one stat() + dict lookup while the file is unchanged;
+    updates are read-merge-write under a per-job lock with an atomic
+    replace so concurrent writers never interleave partial files.
+    """
+
+    def __init__(self, jobs_path: str = "/tmp/jobs"):
+        self.jobs_path = jobs_path
+        ttl = settings.FILE_TTL_HOURS * 3600
+        self._cache: TTLCache = TTLCache(maxsize=_CACHE_MAXSIZE, ttl=ttl)
+        # Note: a lock could in principle be evicted while held if more
+        # than maxsize jobs are actively updating at once; with renders
+        # taking ~a minute each that bound is far beyond this service's
+        # reachable concurrency
+        self._locks: TTLCache = TTLCache(maxsize=_CACHE_MAXSIZE, ttl=ttl)
+
+    def _metadata_path(self, job_id: str) -> str:
+        return f"{self.jobs_path}/{job_id}/metadata.json"
+
+    async def get(self, job_id: str) -> dict | None:
+        """Load job metadata, cached by file mtime. None if missing/corrupt.
+
+        The stat and (on mtime change) read run in a worker thread so
+        the /status poll path never blocks the event loop on disk.
+        """
+        metadata_path = self._metadata_path(job_id)
+        cached = self._cache.get(job_id)
+        cached_mtime = cached[0] if cached is not None else -1
+
+        def _stat_and_read() -> tuple[int, bytes | None] | None:
+            try:
+                st = os.stat(metadata_path)
+                if st.st_mtime_ns == cached_mtime:
+                    return st.st_mtime_ns, None  # cache still valid
+                with open(metadata_path, "rb") as f:
+                    return st.st_mtime_ns, f.read()
+            except OSError:
+                return None
+
+        result = await asyncio.to_thread(_stat_and_read)
+        if result is None:
+            return None
+
+        mtime_ns, raw = result
+        if raw is None:
+            return cached[1]
+
+        try:
+            metadata = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return None
+
+        self._cache[job_id] = (mtime_ns, metadata)
+        return metadata
+
+    async def update(self, job_id: str, **fields) -> bool:
+        """Merge fields into job metadata with an atomic write.
+
+        The write + replace runs in a worker thread, matching the other
+        storage paths.
+        """
+        lock = self._locks.setdefault(job_id, asyncio.Lock())
+        async with lock:
+            current = await self.get(job_id)
+            if current is None:
+                return False
+
+            metadata = {**current, **fields}
+            metadata_path = self._metadata_path(job_id)
+            tmp_path = f"{metadata_path}.tmp"
+            # Compact encoding: nothing reads this file by eye on the
+            # hot path, and skipping indentation shrinks every write
+            data = orjson.dumps(metadata)
+
+            def _write_atomic() -> int:
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, metadata_path)
+                return os.stat(metadata_path).st_mtime_ns
+
+            try:
+                mtime_ns = await asyncio.to_thread(_write_atomic)
+                self._cache[job_id] = (mtime_ns, metadata)
+                return True
+            except OSError as e:
+                logger.error(f"Failed to update metadata for {job_id}: {e}")
+                return False
+
+    def evict(self, job_id: str) -> None:
+        """Drop a job from the cache (e.g. after its files are cleaned up)."""
+        self._cache.pop(job_id, None)
+        self._locks.pop(job_id, None)
+
+
+# Shared store instance used by routes and background tasks
+job_metadata_store = JobMetadataStore()
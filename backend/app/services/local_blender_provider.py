@@ -9,16 +9,51 @@ import asyncio
 import logging
 import time
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Optional
 
+from cachetools import TTLCache
+
 from app.config import settings
 from render_engine.blender_renderer import execute_preset_render
 from .render_provider import RenderProvider
 
 logger = logging.getLogger(__name__)
 
+# Completed jobs are kept at most this long / this many; matches the
+# on-disk file TTL so a long-lived worker's RSS stays bounded
+_JOBS_MAXSIZE = 10_000
+
+
+@dataclass(slots=True)
+class JobState:
+    """
+    In-memory state for one render job.
+
+    A slotted dataclass instead of a per-job dict: attribute access is
+    cheaper, the field set is fixed, and status reads never mutate it.
+    """
+
+    job_id: str
+    asset_path: str
+    preset: str
+    output_path: str
+    queued_at: str
+    status: str = "queued"
+    progress_percent: int = 0
+    estimated_time_remaining: Optional[int] = None
+    error_message: Optional[str] = None
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+    # Monotonic start time for progress math; avoids re-parsing the ISO
+    # started_at string on every status poll
+    started_monotonic: Optional[float] = None
+    # Set once the job reaches a terminal state; waiters wake exactly once
+    # instead of polling at 1Hz
+    done_event: asyncio.Event = field(default_factory=asyncio.Event)
+
 
 class LocalBlenderProvider(RenderProvider):
     """
@@ -30,7 +65,9 @@ class LocalBlenderProvider(RenderProvider):
 
     def __init__(self):
         """Initialize LocalBlenderProvider with empty job tracking."""
-        self._jobs: Dict[str, Dict] = {}
+        self._jobs: TTLCache = TTLCache(
+            maxsize=_JOBS_MAXSIZE, ttl=settings.FILE_TTL_HOURS * 3600
+        )
         self._output_base = Path("/tmp/outputs")
         logger.info("[LOCAL] LocalBlenderProvider initialized")
 
@@ -68,19 +105,13 @@ class LocalBlenderProvider(RenderProvider):
         output_path = str(output_dir / "render.png")
 
         # Initialize job tracking
-        self._jobs[provider_job_id] = {
-            "job_id": job_id,
-            "asset_path": asset_path,
-            "preset": preset,
-            "output_path": output_path,
-            "status": "queued",
-            "progress_percent": 0,
-            "estimated_time_remaining": None,
-            "error_message": None,
-            "started_at": None,
-            "completed_at": None,
-            "queued_at": datetime.now(timezone.utc).isoformat(),
-        }
+        self._jobs[provider_job_id] = JobState(
+            job_id=job_id,
+            asset_path=asset_path,
+            preset=preset,
+            output_path=output_path,
+            queued_at=datetime.now(timezone.utc).isoformat(),
+        )
 
         logger.info(
             f"[LOCAL] Job submitted: {provider_job_id} for job_id={job_id}, "
@@ -106,10 +137,11 @@ class LocalBlenderProvider(RenderProvider):
 
         try:
             # Transition to processing
-            job["status"] = "processing"
-            job["started_at"] = datetime.now(timezone.utc).isoformat()
-            job["progress_percent"] = 10
-            job["estimated_time_remaining"] = settings.RENDER_TIMEOUT
+            job.status = "processing"
+            job.started_at = datetime.now(timezone.utc).isoformat()
+            job.started_monotonic = time.monotonic()
+            job.progress_percent = 10
+            job.estimated_time_remaining = settings.RENDER_TIMEOUT
 
             logger.info(f"[LOCAL] Starting render: {provider_job_id}")
 
@@ -118,41 +150,64 @@ class LocalBlenderProvider(RenderProvider):
             result = await asyncio.get_event_loop().run_in_executor(
                 None,
                 execute_preset_render,
-                job["asset_path"],
-                job["preset"],
-                job["output_path"],
+                job.asset_path,
+                job.preset,
+                job.output_path,
             )
 
             elapsed = time.time() - start_time
 
             if result["success"]:
-                job["status"] = "rendering_complete"
-                job["progress_percent"] = 100
-                job["estimated_time_remaining"] = 0
-                job["completed_at"] = datetime.now(timezone.utc).isoformat()
+                job.status = "rendering_complete"
+                job.progress_percent = 100
+                job.estimated_time_remaining = 0
+                job.completed_at = datetime.now(timezone.utc).isoformat()
                 logger.info(
                     f"[LOCAL] Render complete: {provider_job_id} "
                     f"in {elapsed:.2f}s"
                 )
             else:
-                job["status"] = "failed"
-                job["error_message"] = result.get("error", "Unknown render error")
-                job["completed_at"] = datetime.now(timezone.utc).isoformat()
+                job.status = "failed"
+                job.error_message = result.get("error", "Unknown render error")
+                job.completed_at = datetime.now(timezone.utc).isoformat()
                 logger.error(
                     f"[LOCAL] Render failed: {provider_job_id} - "
-                    f"{job['error_message']}"
+                    f"{job.error_message}"
                 )
 
         except Exception as e:
-            job["status"] = "failed"
-            job["error_message"] = str(e)
-            job["completed_at"] = datetime.now(timezone.utc).isoformat()
+            job.status = "failed"
+            job.error_message = str(e)
+            job.completed_at = datetime.now(timezone.utc).isoformat()
             logger.exception(f"[LOCAL] Render exception: {provider_job_id}")
 
+        finally:
+            job.done_event.set()
+
+    async def wait_done(self, provider_job_id: str, timeout: float) -> None:
+        """
+        Wait until a job reaches a terminal state.
+
+        Args:
+            provider_job_id: Provider job ID from submit_job()
+            timeout: Maximum seconds to wait
+
+        Raises:
+            KeyError: If provider_job_id not found
+            asyncio.TimeoutError: If the job doesn't finish within timeout
+        """
+        job = self._jobs.get(provider_job_id)
+        if job is None:
+            raise KeyError(f"Job not found: {provider_job_id}")
+        await asyncio.wait_for(job.done_event.wait(), timeout=timeout)
+
     async def get_status(self, provider_job_id: str) -> Dict:
         """
         Get current status of a render job.
 
+        Progress is computed into locals; a status read never mutates
+        the job state, so concurrent polls are safe without locking.
+
         Args:
             provider_job_id: Provider job ID from submit_job()
 
@@ -167,25 +222,24 @@ class LocalBlenderProvider(RenderProvider):
 
         job = self._jobs[provider_job_id]
 
+        progress = job.progress_percent
+        remaining = job.estimated_time_remaining
+
         # Estimate progress based on elapsed time if processing
-        if job["status"] == "processing" and job["started_at"]:
-            started = datetime.fromisoformat(job["started_at"])
-            elapsed = (datetime.now(timezone.utc) - started).total_seconds()
+        if job.status == "processing" and job.started_monotonic is not None:
+            elapsed = time.monotonic() - job.started_monotonic
             expected_duration = 60.0  # Assume ~60s for typical render
 
             progress = min(95, int((elapsed / expected_duration) * 100))
             remaining = max(0, int(expected_duration - elapsed))
 
-            job["progress_percent"] = progress
-            job["estimated_time_remaining"] = remaining
-
         return {
-            "status": job["status"],
-            "progress_percent": job["progress_percent"],
-            "estimated_time_remaining": job["estimated_time_remaining"],
-            "error_message": job["error_message"],
-            "started_at": job["started_at"],
-            "completed_at": job["completed_at"],
+            "status": job.status,
+            "progress_percent": progress,
+            "estimated_time_remaining": remaining,
+            "error_message": job.error_message,
+            "started_at": job.started_at,
+            "completed_at": job.completed_at,
         }
 
     async def get_result(self, provider_job_id: str) -> Optional[bytes]:
@@ -206,10 +260,10 @@ class LocalBlenderProvider(RenderProvider):
 
         job = self._jobs[provider_job_id]
 
-        if job["status"] != "rendering_complete":
+        if job.status != "rendering_complete":
             return None
 
-        output_path = Path(job["output_path"])
+        output_path = Path(job.output_path)
         if not output_path.exists():
             logger.error(f"[LOCAL] Output file missing: {output_path}")
             return None
@@ -9,14 +9,21 @@ import asyncio
 import logging
 import random
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional
 
+from cachetools import TTLCache
+
+from app.config import settings
+
 from .local_blender_provider import LocalBlenderProvider
 from .render_provider import RenderProvider
 
 logger = logging.getLogger(__name__)
 
+# Mirror of LocalBlenderProvider's bound: jobs age out with the file TTL
+_JOBS_MAXSIZE = 10_000
+
 
 class MockAIDPProvider(RenderProvider):
     """
@@ -32,7 +39,9 @@ class MockAIDPProvider(RenderProvider):
     def __init__(self):
         """Initialize MockAIDPProvider with LocalBlenderProvider backend."""
         self._local_provider = LocalBlenderProvider()
-        self._jobs: Dict[str, Dict] = {}
+        self._jobs: TTLCache = TTLCache(
+            maxsize=_JOBS_MAXSIZE, ttl=settings.FILE_TTL_HOURS * 3600
+        )
         logger.info("[MOCK-AIDP] MockAIDPProvider initialized (simulating AIDP API)")
 
     @property
@@ -64,7 +73,9 @@ class MockAIDPProvider(RenderProvider):
 
         # Initialize job tracking with AIDP metadata
         queue_delay = random.uniform(2.0, 5.0)
+        done_event = asyncio.Event()
         self._jobs[aidp_job_id] = {
+            "done_event": done_event,
             "job_id": job_id,
             "asset_path": asset_path,
             "preset": preset,
@@ -121,45 +132,42 @@ class MockAIDPProvider(RenderProvider):
             )
             job["local_provider_job_id"] = local_job_id
 
-            # Poll local provider until complete
-            while True:
-                await asyncio.sleep(1.0)
-
-                try:
-                    local_status = await self._local_provider.get_status(local_job_id)
-                except KeyError:
-                    job["status"] = "failed"
-                    job["error_message"] = "Local provider lost job"
-                    job["completed_at"] = datetime.now(timezone.utc).isoformat()
-                    break
-
-                # Update progress from local provider
-                job["progress_percent"] = local_status["progress_percent"]
-                job["estimated_time_remaining"] = local_status[
-                    "estimated_time_remaining"
-                ]
-
-                if local_status["status"] == "rendering_complete":
-                    job["status"] = "rendering_complete"
-                    job["progress_percent"] = 100
-                    job["estimated_time_remaining"] = 0
-                    job["completed_at"] = datetime.now(timezone.utc).isoformat()
-                    logger.info(
-                        f"[MOCK-AIDP] Job complete: {aidp_job_id}"
-                    )
-                    break
-
-                elif local_status["status"] == "failed":
-                    job["status"] = "failed"
-                    job["error_message"] = local_status.get(
-                        "error_message", "Render failed"
-                    )
-                    job["completed_at"] = datetime.now(timezone.utc).isoformat()
-                    logger.error(
-                        f"[MOCK-AIDP] Job failed: {aidp_job_id} - "
-                        f"{job['error_message']}"
-                    )
-                    break
+            # Wake exactly once on completion instead of polling at 1Hz
+            await self._local_provider.wait_done(
+                local_job_id, timeout=settings.RENDER_TIMEOUT + 60
+            )
+            local_status = await self._local_provider.get_status(local_job_id)
+
+            job["progress_percent"] = local_status["progress_percent"]
+            job["estimated_time_remaining"] = local_status["estimated_time_remaining"]
+
+            if local_status["status"] == "rendering_complete":
+                job["status"] = "rendering_complete"
+                job["progress_percent"] = 100
+                job["estimated_time_remaining"] = 0
+                job["completed_at"] = datetime.now(timezone.utc).isoformat()
+                logger.info(f"[MOCK-AIDP] Job complete: {aidp_job_id}")
+            else:
+                job["status"] = "failed"
+                job["error_message"] = local_status.get(
+                    "error_message", "Render failed"
+                )
+                job["completed_at"] = datetime.now(timezone.utc).isoformat()
+                logger.error(
+                    f"[MOCK-AIDP] Job failed: {aidp_job_id} - "
+                    f"{job['error_message']}"
+                )
+
+        except KeyError:
+            job["status"] = "failed"
+            job["error_message"] = "Local provider lost job"
+            job["completed_at"] = datetime.now(timezone.utc).isoformat()
+
+        except asyncio.TimeoutError:
+            job["status"] = "failed"
+            job["error_message"] = "Render timed out"
+            job["completed_at"] = datetime.now(timezone.utc).isoformat()
+            logger.error(f"[MOCK-AIDP] Job timed out: {aidp_job_id}")
 
         except Exception as e:
             job["status"] = "failed"
@@ -167,6 +175,26 @@ class MockAIDPProvider(RenderProvider):
             job["completed_at"] = datetime.now(timezone.utc).isoformat()
             logger.exception(f"[MOCK-AIDP] Job exception: {aidp_job_id}")
 
+        finally:
+            job["done_event"].set()
+
+    async def wait_done(self, provider_job_id: str, timeout: float) -> None:
+        """
+        Wait until a job reaches a terminal state.
+
+        Args:
+            provider_job_id: AIDP job ID from submit_job()
+            timeout: Maximum seconds to wait
+
+        Raises:
+            KeyError: If provider_job_id not found
+            asyncio.TimeoutError: If the job doesn't finish within timeout
+        """
+        job = self._jobs.get(provider_job_id)
+        if job is None:
+            raise KeyError(f"Job not found: {provider_job_id}")
+        await asyncio.wait_for(job["done_event"].wait(), timeout=timeout)
+
     async def get_status(self, provider_job_id: str) -> Dict:
         """
         Get current status with AIDP-style metadata.
@@ -186,27 +214,34 @@ class MockAIDPProvider(RenderProvider):
 
         job = self._jobs[provider_job_id]
 
-        # Calculate estimated completion time
+        progress = job["progress_percent"]
+        remaining = job["estimated_time_remaining"]
+
+        # While processing, pull live progress from the local provider on
+        # demand (the lifecycle task no longer polls in the background)
+        if job["status"] == "processing" and job["local_provider_job_id"]:
+            try:
+                local_status = await self._local_provider.get_status(
+                    job["local_provider_job_id"]
+                )
+                progress = local_status["progress_percent"]
+                remaining = local_status["estimated_time_remaining"]
+            except KeyError:
+                pass
+
+        # Calculate estimated completion time (no ISO re-parse needed)
         estimated_completion = None
         if job["status"] == "processing" and job["started_at"]:
-            started = datetime.fromisoformat(job["started_at"])
-            remaining = job.get("estimated_time_remaining") or 60
-            estimated_completion = (
-                started.replace(tzinfo=timezone.utc)
-                .isoformat()
-                .replace("+00:00", "Z")
+            est_complete = datetime.now(timezone.utc) + timedelta(
+                seconds=remaining or 60
             )
-            if remaining > 0:
-                from datetime import timedelta
-
-                est_complete = datetime.now(timezone.utc) + timedelta(seconds=remaining)
-                estimated_completion = est_complete.isoformat().replace("+00:00", "Z")
+            estimated_completion = est_complete.isoformat().replace("+00:00", "Z")
 
         return {
             "job_id": provider_job_id,
             "status": job["status"],
-            "progress_percent": job["progress_percent"],
-            "estimated_time_remaining": job["estimated_time_remaining"],
+            "progress_percent": progress,
+            "estimated_time_remaining": remaining,
             "error_message": job["error_message"],
             "started_at": job["started_at"],
             "completed_at": job["completed_at"],
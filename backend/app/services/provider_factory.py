@@ -5,6 +5,7 @@ Returns appropriate RenderProvider based on USE_MOCK_AIDP configuration.
 """
 
 import logging
+from functools import lru_cache
 
 from app.config import settings
 from .mock_aidp_provider import MockAIDPProvider
@@ -12,15 +13,14 @@ from .render_provider import RenderProvider
 
 logger = logging.getLogger(__name__)
 
-# Singleton provider instance
-_provider_instance: RenderProvider | None = None
-
 
+@lru_cache(maxsize=1)
 def get_render_provider() -> RenderProvider:
     """
     Get the configured render provider instance.
 
-    Uses singleton pattern to maintain job state across requests.
+    lru_cache makes the singleton thread-safe (no check-then-set race
+    on a first-request storm) and branch-free after the first call.
 
     Returns:
         RenderProvider: MockAIDPProvider if USE_MOCK_AIDP=true,
@@ -29,27 +29,20 @@ def get_render_provider() -> RenderProvider:
     Raises:
         NotImplementedError: If USE_MOCK_AIDP=false (real AIDP not yet implemented)
     """
-    global _provider_instance
-
-    if _provider_instance is not None:
-        return _provider_instance
-
     if settings.USE_MOCK_AIDP:
         logger.info(
             "Initializing MockAIDPProvider (USE_MOCK_AIDP=true) - "
             "local Blender rendering with simulated AIDP lifecycle"
         )
-        _provider_instance = MockAIDPProvider()
-    else:
-        # Future: Story 1.6.1 will implement real AIDP provider
-        # from .aidp_provider import AIDPProvider
-        # _provider_instance = AIDPProvider()
-        raise NotImplementedError(
-            "Real AIDP provider not yet implemented. "
-            "Set USE_MOCK_AIDP=true or see Story 1.6.1 for AIDP integration."
-        )
+        return MockAIDPProvider()
 
-    return _provider_instance
+    # Future: Story 1.6.1 will implement real AIDP provider
+    # from .aidp_provider import AIDPProvider
+    # return AIDPProvider()
+    raise NotImplementedError(
+        "Real AIDP provider not yet implemented. "
+        "Set USE_MOCK_AIDP=true or see Story 1.6.1 for AIDP integration."
+    )
 
 
 def reset_provider() -> None:
@@ -59,6 +52,5 @@ def reset_provider() -> None:
     Clears the cached provider instance, allowing a fresh
     provider to be created on next get_render_provider() call.
     """
-    global _provider_instance
-    _provider_instance = None
+    get_render_provider.cache_clear()
     logger.info("Provider singleton reset")
@@ -4,20 +4,52 @@ Rate Limiter Service
 In-memory rate limiting with sliding window algorithm.
 """
 
+import asyncio
+import ipaddress
 import logging
-from collections import defaultdict
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
 
 from fastapi import HTTPException, Request, status
 
 logger = logging.getLogger(__name__)
 
+# Hard cap on tracked IPs: a distributed scan can't grow RSS past this
+MAX_TRACKED_IPS = 100_000
 
-class RateLimiter:
+# Aggregate IPv6 clients per /64: a single host usually controls the
+# whole /64, so rotating within it shouldn't dodge the limit
+_IPV6_64_MASK = ((1 << 64) - 1) << 64
+
+
+def _bucket_key(host: str) -> int:
     """
-    In-memory rate limiter using sliding window algorithm.
+    Convert a client address to a compact integer bucket key.
 
-    Tracks requests per IP address and enforces rate limits.
+    Integers cost ~28 bytes versus ~70+ for the address string; IPv6
+    addresses are masked to their /64.
+    """
+    try:
+        addr = ipaddress.ip_address(host)
+    except ValueError:
+        # Non-IP hosts (e.g. test clients, unix sockets)
+        return hash(host)
+    value = int(addr)
+    if addr.version == 6:
+        return value & _IPV6_64_MASK
+    return value
+
+
+class RateLimiter:
+    """
+    In-memory rate limiter using a sliding-window counter.
+
+    Instead of storing every request timestamp, each IP keeps three
+    integers: the current window index plus request counts for the
+    previous and current windows. The effective rate is estimated by
+    weighting the previous window by its remaining overlap with the
+    sliding window (Cloudflare's approximation), making checks O(1)
+    with ~24 bytes of state per IP.
     """
 
     def __init__(self, max_requests: int, window_seconds: int):
@@ -30,16 +62,18 @@ class RateLimiter:
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = defaultdict(list)  # IP -> list of timestamps
+        # IP bucket key -> (window_index, previous-window count, current-window count)
+        # Ordered so the least recently seen IP evicts first at the cap
+        self.buckets: OrderedDict[int, tuple[int, int, int]] = OrderedDict()
 
     def check_rate_limit(self, ip: str) -> None:
         """
         Check if IP has exceeded rate limit.
 
-        Uses sliding window algorithm:
-        1. Remove old requests outside time window
-        2. Check if remaining requests exceed limit
-        3. Record current request timestamp
+        Uses monotonic float time (immune to wall-clock jumps):
+        1. Rotate the window counters if the window has advanced
+        2. Estimate the sliding-window rate from the two counters
+        3. Record the request in the current window
 
         Args:
             ip: Client IP address
@@ -47,32 +81,74 @@ class RateLimiter:
         Raises:
             HTTPException: 429 if rate limit exceeded
         """
-        now = datetime.now()
-        cutoff = now - timedelta(seconds=self.window_seconds)
-
-        # Remove old requests outside window
-        self.requests[ip] = [
-            req_time for req_time in self.requests[ip]
-            if req_time > cutoff
-        ]
+        key = _bucket_key(ip)
+        now = time.monotonic()
+        window_index = int(now // self.window_seconds)
 
-        # Check if limit exceeded
-        if len(self.requests[ip]) >= self.max_requests:
+        index, prev_count, curr_count = self.buckets.get(
+            key, (window_index, 0, 0)
+        )
+        if index != window_index:
+            if index == window_index - 1:
+                prev_count, curr_count = curr_count, 0
+            else:
+                prev_count, curr_count = 0, 0
+
+        # Weight the previous window by how much of it still overlaps
+        # the sliding window ending now
+        elapsed_fraction = (now % self.window_seconds) / self.window_seconds
+        estimated = curr_count + prev_count * (1.0 - elapsed_fraction)
+
+        if estimated >= self.max_requests:
             logger.warning(
-                f"Rate limit exceeded for IP {ip}: "
-                f"{len(self.requests[ip])} requests in window"
+                "Rate limit exceeded for IP %s: ~%.1f requests in window",
+                ip,
+                estimated,
             )
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail=f"Rate limit exceeded. Max {self.max_requests} uploads per hour."
             )
 
-        # Record this request
-        self.requests[ip].append(now)
-        logger.info(
-            f"Rate limit check passed: {ip} has "
-            f"{len(self.requests[ip])} requests in window"
-        )
+        # Record this request (most recently seen IP moves to the back)
+        self.buckets[key] = (window_index, prev_count, curr_count + 1)
+        self.buckets.move_to_end(key)
+        while len(self.buckets) > MAX_TRACKED_IPS:
+            self.buckets.popitem(last=False)
+
+        # Accepted requests log at DEBUG only; formatting is deferred so
+        # the happy path costs nothing when the level is higher
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Rate limit check passed: %s has %d requests in current window",
+                ip,
+                curr_count + 1,
+            )
+
+    def evict_stale(self) -> int:
+        """
+        Drop IPs whose counters can no longer influence a rate decision.
+
+        Returns:
+            int: Number of entries removed
+        """
+        current_index = int(time.monotonic() // self.window_seconds)
+        stale = [
+            key
+            for key, (index, _, _) in self.buckets.items()
+            if index < current_index - 1
+        ]
+        for key in stale:
+            del self.buckets[key]
+        return len(stale)
+
+    async def evict_loop(self) -> None:
+        """Periodically sweep stale IPs; run as a background task."""
+        while True:
+            await asyncio.sleep(self.window_seconds)
+            removed = self.evict_stale()
+            if removed:
+                logger.info(f"Rate limiter evicted {removed} stale IPs")
 
 
 # Global rate limiter instance: 10 uploads per hour
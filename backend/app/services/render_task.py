@@ -5,59 +5,54 @@ Polls render provider and updates job metadata.json until completion.
 """
 
 import asyncio
-import json
+import hashlib
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
 
+from app.config import settings
+
+from .job_metadata import job_metadata_store
 from .render_provider import RenderProvider
 
 logger = logging.getLogger(__name__)
 
 
-def _update_job_metadata(job_id: str, **updates) -> bool:
-    """Update job metadata JSON file with given fields."""
-    metadata_path = Path(f"/tmp/jobs/{job_id}/metadata.json")
-    if not metadata_path.exists():
-        logger.warning(f"Metadata file not found: {metadata_path}")
-        return False
-
-    try:
-        with open(metadata_path) as f:
-            metadata = json.load(f)
-
-        metadata.update(updates)
-
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
-
-        return True
+def _utc_now_iso() -> str:
+    """Current UTC time as an ISO-8601 string (one call site per branch)."""
+    return datetime.now(timezone.utc).isoformat()
 
-    except (json.JSONDecodeError, OSError) as e:
-        logger.error(f"Failed to update metadata for {job_id}: {e}")
-        return False
 
-
-def _save_render_output(job_id: str, result_bytes: bytes) -> str | None:
+async def _save_render_output(
+    job_id: str, result_bytes: bytes
+) -> tuple[str, str] | None:
     """
-    Save rendered PNG to output directory.
+    Save rendered PNG to output directory, hashing it on the way down.
+
+    The bytes are already in memory, so the SHA-256 the proof needs is
+    computed here instead of re-reading the file later. The multi-MB
+    write runs in a worker thread so the event loop stays responsive.
 
     Args:
         job_id: Job identifier
         result_bytes: PNG image bytes
 
     Returns:
-        str: Path to saved file, or None if failed
+        tuple: (path to saved file, SHA-256 hex digest), or None if failed
     """
     output_dir = Path(f"/tmp/outputs/{job_id}")
-    output_dir.mkdir(parents=True, exist_ok=True)
-
     output_path = output_dir / "render.png"
 
-    try:
+    def _write() -> str:
+        digest = hashlib.sha256(result_bytes).hexdigest()
+        output_dir.mkdir(parents=True, exist_ok=True)
         output_path.write_bytes(result_bytes)
+        return digest
+
+    try:
+        output_hash = await asyncio.to_thread(_write)
         logger.info(f"Saved render output: {output_path}")
-        return str(output_path)
+        return str(output_path), output_hash
     except OSError as e:
         logger.error(f"Failed to save render output for {job_id}: {e}")
         return None
@@ -86,65 +81,104 @@ async def execute_render_job(
         f"provider_job_id={provider_job_id}"
     )
 
+    last_written: dict = {}
+    wait_done = getattr(provider, "wait_done", None)
+
     try:
         while True:
-            await asyncio.sleep(poll_interval)
+            if wait_done is not None:
+                # Event-driven: sleep until the provider signals a
+                # terminal state, then read the final status once
+                try:
+                    await wait_done(
+                        provider_job_id, timeout=settings.RENDER_TIMEOUT + 120
+                    )
+                except asyncio.TimeoutError:
+                    logger.error(f"Render monitor timed out: {job_id}")
+                    await job_metadata_store.update(
+                        job_id,
+                        status="failed",
+                        error="Render timed out",
+                        completedAt=_utc_now_iso(),
+                    )
+                    break
+            else:
+                await asyncio.sleep(poll_interval)
 
             try:
                 status = await provider.get_status(provider_job_id)
             except KeyError:
                 logger.error(f"Provider lost job: {provider_job_id}")
-                _update_job_metadata(
+                await job_metadata_store.update(
                     job_id,
                     status="failed",
                     error="Provider lost job during processing",
-                    completedAt=datetime.now(timezone.utc).isoformat(),
+                    completedAt=_utc_now_iso(),
                 )
                 break
 
-            # Update metadata with current status
-            _update_job_metadata(
-                job_id,
-                status=status["status"],
-                progressPercent=status.get("progress_percent", 0),
-                error=status.get("error_message"),
-            )
-
             if status["status"] == "rendering_complete":
-                # Get render result and save
+                # Get render result and save; one write covers status,
+                # renderUrl and completedAt together
                 result = await provider.get_result(provider_job_id)
+                completion = {
+                    "status": "rendering_complete",
+                    "progressPercent": 100,
+                    "error": None,
+                    "completedAt": _utc_now_iso(),
+                }
                 if result:
-                    output_path = _save_render_output(job_id, result)
-                    _update_job_metadata(
-                        job_id,
-                        renderUrl=f"/outputs/{job_id}/render.png",
-                        completedAt=datetime.now(timezone.utc).isoformat(),
-                    )
+                    saved = await _save_render_output(job_id, result)
+                    if saved is not None:
+                        completion["renderUrl"] = f"/outputs/{job_id}/render.png"
+                        # Recorded so proof generation can skip re-hashing
+                        completion["outputHash"] = saved[1]
                     logger.info(f"Render job complete: {job_id}")
                 else:
                     logger.warning(f"No result bytes for completed job: {job_id}")
+                await job_metadata_store.update(job_id, **completion)
                 break
 
             elif status["status"] == "failed":
-                _update_job_metadata(
+                await job_metadata_store.update(
                     job_id,
+                    status="failed",
+                    progressPercent=status.get("progress_percent", 0),
                     error=status.get("error_message", "Render failed"),
-                    completedAt=datetime.now(timezone.utc).isoformat(),
+                    completedAt=_utc_now_iso(),
                 )
                 logger.error(
                     f"Render job failed: {job_id} - {status.get('error_message')}"
                 )
                 break
 
+            # In-flight poll: only touch disk when something changed
+            updates = {
+                "status": status["status"],
+                "progressPercent": status.get("progress_percent", 0),
+                "error": status.get("error_message"),
+            }
+            if updates != last_written:
+                await job_metadata_store.update(job_id, **updates)
+                last_written = updates
+
+            if wait_done is not None:
+                # wait_done signalled but the status isn't terminal;
+                # don't spin on an already-set event
+                logger.warning(
+                    f"Provider signalled done with non-terminal status for {job_id}"
+                )
+                break
+
     except asyncio.CancelledError:
         logger.warning(f"Render monitor cancelled: {job_id}")
         raise
 
     except Exception as e:
         logger.exception(f"Render monitor error: {job_id}")
-        _update_job_metadata(
+        await job_metadata_store.update(
             job_id,
             status="failed",
             error=str(e),
-            completedAt=datetime.now(timezone.utc).isoformat(),
+            completedAt=_utc_now_iso(),
         )
@@ -1,10 +1,11 @@
 """Cryptographic proof generation module."""
 
 from .exceptions import FileHashError, PresetNotFoundError, ProofGenerationError
-from .proof_generator import ProofGenerator
+from .proof_generator import ProofGenerator, get_proof_generator
 
 __all__ = [
     "ProofGenerator",
+    "get_proof_generator",
     "ProofGenerationError",
     "FileHashError",
     "PresetNotFoundError",
@@ -3,17 +3,21 @@
 import hashlib
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
 import yaml
 
 from .exceptions import FileHashError, PresetNotFoundError
 
 logger = logging.getLogger(__name__)
 
-CHUNK_SIZE = 8192
+# Shared pool for overlapping the two independent file hashes per proof;
+# hashlib releases the GIL during updates, so both streams run in parallel
+_hash_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="proof-hash")
 
 
 class ProofGenerator:
@@ -22,6 +26,9 @@ class ProofGenerator:
     def __init__(self) -> None:
         """Initialize the ProofGenerator."""
         self._presets_cache: dict[str, dict[str, Any]] | None = None
+        # Scene-params hashes computed once per preset at cache build:
+        # preset configs are immutable between reloads
+        self._scene_hashes: dict[str, str] = {}
 
     def compute_file_hash(self, file_path: str) -> str:
         """Compute SHA-256 hash of a file, returning 64-char hex digest.
@@ -41,11 +48,10 @@ class ProofGenerator:
             raise FileNotFoundError(f"File not found: {file_path}")
 
         try:
-            sha256 = hashlib.sha256()
+            # file_digest drives a C-level read loop straight into OpenSSL
+            # (large blocks, no per-chunk Python bytes objects)
             with open(path, "rb") as f:
-                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
-                    sha256.update(chunk)
-            return sha256.hexdigest()
+                return hashlib.file_digest(f, "sha256").hexdigest()
         except PermissionError as e:
             logger.error(f"Permission denied reading file: {file_path}")
             raise FileHashError(f"Permission denied reading file: {file_path}") from e
@@ -66,7 +72,10 @@ class ProofGenerator:
         return hashlib.sha256(json_str.encode("utf-8")).hexdigest()
 
     def _load_preset_config(self, preset_name: str) -> dict[str, Any]:
-        """Load preset configuration from presets.yaml.
+        """Load preset configuration from presets.yaml, cached by name.
+
+        The YAML file is read and parsed once per generator; subsequent
+        lookups are a dict read.
 
         Args:
             preset_name: Name of the preset to load.
@@ -78,26 +87,38 @@ class ProofGenerator:
             PresetNotFoundError: If the preset name is not found.
             FileHashError: If presets.yaml cannot be read.
         """
-        presets_path = Path(__file__).parent.parent / "render_engine" / "presets.yaml"
+        if self._presets_cache is None:
+            presets_path = (
+                Path(__file__).parent.parent / "render_engine" / "presets.yaml"
+            )
+
+            try:
+                with open(presets_path, "r") as f:
+                    data = yaml.safe_load(f)
+            except FileNotFoundError as e:
+                logger.error(f"Presets file not found: {presets_path}")
+                raise FileHashError(f"Presets file not found: {presets_path}") from e
+            except yaml.YAMLError as e:
+                logger.error(f"Error parsing presets.yaml: {e}")
+                raise FileHashError(f"Error parsing presets.yaml: {e}") from e
+            except IOError as e:
+                logger.error(f"Error reading presets.yaml: {e}")
+                raise FileHashError(f"Error reading presets.yaml: {e}") from e
+
+            self._presets_cache = {
+                preset["name"]: preset
+                for preset in data.get("presets", [])
+                if "name" in preset
+            }
+            self._scene_hashes = {
+                name: self.compute_scene_hash(preset)
+                for name, preset in self._presets_cache.items()
+            }
 
         try:
-            with open(presets_path, "r") as f:
-                data = yaml.safe_load(f)
-        except FileNotFoundError as e:
-            logger.error(f"Presets file not found: {presets_path}")
-            raise FileHashError(f"Presets file not found: {presets_path}") from e
-        except yaml.YAMLError as e:
-            logger.error(f"Error parsing presets.yaml: {e}")
-            raise FileHashError(f"Error parsing presets.yaml: {e}") from e
-        except IOError as e:
-            logger.error(f"Error reading presets.yaml: {e}")
-            raise FileHashError(f"Error reading presets.yaml: {e}") from e
-
-        for preset in data.get("presets", []):
-            if preset.get("name") == preset_name:
-                return preset
-
-        raise PresetNotFoundError(f"Unknown preset: {preset_name}")
+            return self._presets_cache[preset_name]
+        except KeyError:
+            raise PresetNotFoundError(f"Unknown preset: {preset_name}") from None
 
     def generate_proof(
         self,
@@ -108,6 +129,7 @@ class ProofGenerator:
         aidp_job_id: str,
         blender_version: str = "3.6.5",
         render_duration: float = 0.0,
+        output_hash: str | None = None,
     ) -> dict[str, Any]:
         """Generate cryptographic proof structure for a completed render.
 
@@ -119,6 +141,8 @@ class ProofGenerator:
             aidp_job_id: AIDP network job ID.
             blender_version: Version of Blender used for rendering.
             render_duration: Time taken to render in seconds.
+            output_hash: Precomputed SHA-256 of the output, if the caller
+                already hashed the bytes while writing them.
 
         Returns:
             Dictionary containing the complete proof structure.
@@ -128,11 +152,18 @@ class ProofGenerator:
             FileHashError: If there's an error computing hashes.
             PresetNotFoundError: If preset name is invalid.
         """
-        asset_hash = self.compute_file_hash(asset_path)
+        if output_hash is None:
+            # Asset and output hashes are independent: overlap them on two
+            # threads so wall time is max(asset, output) instead of the sum
+            asset_hash, output_hash = _hash_pool.map(
+                self.compute_file_hash, [asset_path, output_path]
+            )
+        else:
+            asset_hash = self.compute_file_hash(asset_path)
         preset_config = self._load_preset_config(preset_name)
-        scene_params_hash = self.compute_scene_hash(preset_config)
-        output_hash = self.compute_file_hash(output_path)
-        timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        scene_params_hash = self._scene_hashes[preset_name]
+        # strftime emits the Z suffix directly; no isoformat + str.replace
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
 
         samples = preset_config.get("samples", 128)
 
@@ -172,10 +203,22 @@ class ProofGenerator:
         proof_path = output_dir / "proof.json"
 
         try:
-            with open(proof_path, "w") as f:
-                json.dump(proof, f, indent=2)
+            proof_path.write_bytes(orjson.dumps(proof, option=orjson.OPT_INDENT_2))
             logger.info(f"Saved proof to {proof_path}")
             return str(proof_path)
         except IOError as e:
             logger.error(f"Error saving proof to {proof_path}: {e}")
             raise
+
+
+# Singleton generator instance (mirrors provider_factory.get_render_provider):
+# the preset cache then persists across requests
+_proof_generator_instance: ProofGenerator | None = None
+
+
+def get_proof_generator() -> ProofGenerator:
+    """Return the process-wide ProofGenerator instance."""
+    global _proof_generator_instance
+    if _proof_generator_instance is None:
+        _proof_generator_instance = ProofGenerator()
+    return _proof_generator_instance
@@ -4,7 +4,10 @@ Blender headless rendering orchestration module.
 Handles Blender subprocess execution, monitoring, and validation.
 """
 
+import json
 import logging
+import os
+import struct
 import subprocess
 import time
 import uuid
@@ -20,14 +23,31 @@ from .scene_generator import generate_preset_scene
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Process handle reused across renders: constructing psutil.Process()
+# re-reads /proc/self per instantiation
+_SELF = psutil.Process()
+
+
+# Set once the probe succeeds; failures are never cached so a transient
+# error (binary on a late-mounted volume, momentary exec failure) is
+# retried on the next render instead of poisoning the process
+_blender_validated = False
+
 
 def _validate_blender_binary() -> bool:
     """
     Check if Blender binary is available and executable.
 
+    The subprocess version probe runs until it succeeds once; after
+    that, calls are a flag check.
+
     Returns:
         bool: True if Blender is accessible, False otherwise
     """
+    global _blender_validated
+    if _blender_validated:
+        return True
+
     try:
         result = subprocess.run(
             [settings.BLENDER_BINARY, "--version"],
@@ -37,6 +57,7 @@ def _validate_blender_binary() -> bool:
             check=True,
         )
         logger.info(f"Blender binary validated: {result.stdout.strip().split()[0:2]}")
+        _blender_validated = True
         return True
     except (
         FileNotFoundError,
@@ -47,10 +68,22 @@ def _validate_blender_binary() -> bool:
         return False
 
 
+# PNG signature + the IHDR chunk header/width/height fit in 24 bytes
+_PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+# A genuinely blank 1024x1024 PNG deflates to well under this; anything
+# larger has pixel variance and skips the decode-based blank check
+_BLANK_SUSPECT_SIZE = 2048
+
+
 def _verify_output(output_path: str) -> bool:
     """
     Verify rendered output file is valid PNG with correct dimensions.
 
+    Reads only the 24-byte PNG header (signature + IHDR dimensions)
+    instead of decoding the full image; a Pillow decode at reduced
+    resolution runs only when the file is small enough to be blank.
+
     Args:
         output_path: Path to output PNG file
 
@@ -68,30 +101,35 @@ def _verify_output(output_path: str) -> bool:
         raise Exception("Output file not found")
 
     # Check file size > 0
-    if output_file.stat().st_size == 0:
+    file_size = output_file.stat().st_size
+    if file_size == 0:
         logger.error(f"Output file is empty: {output_path}")
         raise Exception("Output file is empty")
 
     try:
-        # Validate PNG structure with Pillow
-        img = Image.open(output_path)
+        with open(output_path, "rb") as f:
+            header = f.read(24)
+
+        # Verify format is PNG
+        if header[:8] != _PNG_MAGIC or header[12:16] != b"IHDR":
+            logger.error(f"Output format incorrect, expected PNG: {output_path}")
+            raise Exception("Invalid format: not a PNG")
 
-        # Verify dimensions (1024x1024)
-        if img.size != (1024, 1024):
+        # Verify dimensions (1024x1024) straight from IHDR
+        dimensions = struct.unpack(">II", header[16:24])
+        if dimensions != (1024, 1024):
             logger.error(
-                f"Output dimensions incorrect: {img.size}, expected (1024, 1024)"
+                f"Output dimensions incorrect: {dimensions}, expected (1024, 1024)"
             )
-            raise Exception(f"Invalid dimensions: {img.size}")
+            raise Exception(f"Invalid dimensions: {dimensions}")
 
-        # Verify format is PNG
-        if img.format != "PNG":
-            logger.error(f"Output format incorrect: {img.format}, expected PNG")
-            raise Exception(f"Invalid format: {img.format}")
-
-        # Ensure image is not blank (check pixel variance)
-        extrema = img.getextrema()
-        if extrema == (0, 0) or extrema == (255, 255):
-            logger.warning("Output image may be blank (no pixel variance)")
+        # Blank-image heuristic: only decode (at 1/16 resolution) when the
+        # file is small enough that zero pixel variance is plausible
+        if file_size < _BLANK_SUSPECT_SIZE:
+            img = Image.open(output_path)
+            extrema = img.reduce(16).getextrema()
+            if extrema == (0, 0) or extrema == (255, 255):
+                logger.warning("Output image may be blank (no pixel variance)")
 
         logger.info(f"Output verified: 1024x1024 PNG at {output_path}")
         return True
@@ -112,6 +150,69 @@ def _monitor_render_process(process: subprocess.Popen) -> None:
     pass
 
 
+def _execute_render_pooled(
+    scene_script: str, output_path: str, mem_before: float
+) -> Dict[str, Any]:
+    """
+    Execute a render on the persistent Blender worker pool.
+
+    Returns the same result shape as execute_render.
+    """
+    from .worker_pool import get_worker_pool
+
+    start_time = time.time()
+    result = get_worker_pool().render_script(
+        scene_script, timeout=settings.RENDER_TIMEOUT
+    )
+    duration = time.time() - start_time
+
+    mem_used = _SELF.memory_info().rss / 1024 / 1024 - mem_before
+
+    if not result.get("success"):
+        error_msg = result.get("error") or "Unknown render error"
+        logger.error(f"Pooled render failed: {error_msg}")
+        return {
+            "success": False,
+            "output_path": output_path,
+            "duration": duration,
+            "memory_used": mem_used,
+            "error": error_msg,
+        }
+
+    try:
+        _verify_output(output_path)
+    except Exception as e:
+        return {
+            "success": False,
+            "output_path": output_path,
+            "duration": duration,
+            "memory_used": mem_used,
+            "error": f"Output verification failed: {str(e)}",
+        }
+
+    logger.info(f"Pooled render completed in {duration:.2f} seconds")
+    return {
+        "success": True,
+        "output_path": output_path,
+        "duration": duration,
+        "memory_used": mem_used,
+        "error": None,
+    }
+
+
+def _fail(
+    output_path: str, duration: float, error: str, mem_before: float
+) -> Dict[str, Any]:
+    """Build a failure result, reading memory usage exactly once."""
+    return {
+        "success": False,
+        "output_path": output_path,
+        "duration": duration,
+        "memory_used": _SELF.memory_info().rss / 1024 / 1024 - mem_before,
+        "error": error,
+    }
+
+
 def execute_render(scene_script: str, output_path: str) -> Dict[str, Any]:
     """
     Execute Blender headless render with given scene script.
@@ -142,23 +243,38 @@ def execute_render(scene_script: str, output_path: str) -> Dict[str, Any]:
         }
 
     # Track memory before render
-    process = psutil.Process()
-    mem_before = process.memory_info().rss / 1024 / 1024  # MB
-
-    # Create temporary script file
-    script_path = Path("/tmp") / f"render_script_{uuid.uuid4()}.py"
-
-    try:
-        # Write scene script to temporary file
+    mem_before = _SELF.memory_info().rss / 1024 / 1024  # MB
+
+    # Pooled path: reuse a long-lived Blender process instead of paying
+    # bpy/Cycles startup on every render
+    if settings.BLENDER_WORKER_POOL:
+        return _execute_render_pooled(scene_script, output_path, mem_before)
+
+    # Hold the scene script in anonymous memory where possible: no /tmp
+    # write/unlink churn and nothing to leak if the process dies. Blender
+    # reads it back through /proc/self/fd/N (the fd is inherited).
+    script_fd = None
+    script_path = None
+    if hasattr(os, "memfd_create"):
+        try:
+            script_fd = os.memfd_create("blender_script")
+            os.write(script_fd, scene_script.encode())
+            script_arg = f"/proc/self/fd/{script_fd}"
+        except OSError:
+            script_fd = None
+    if script_fd is None:
+        script_path = Path("/tmp") / f"render_script_{uuid.uuid4()}.py"
         script_path.write_text(scene_script)
+        script_arg = str(script_path)
         logger.info(f"Created temporary render script: {script_path}")
 
+    try:
         # Construct Blender command
         command = [
             settings.BLENDER_BINARY,
             "--background",
             "--python",
-            str(script_path),
+            script_arg,
             "--",
             "--output",
             output_path,
@@ -175,6 +291,7 @@ def execute_render(scene_script: str, output_path: str) -> Dict[str, Any]:
             text=True,
             timeout=settings.RENDER_TIMEOUT,
             check=True,
+            pass_fds=(script_fd,) if script_fd is not None else (),
         )
 
         # Calculate render duration
@@ -182,7 +299,7 @@ def execute_render(scene_script: str, output_path: str) -> Dict[str, Any]:
         duration = end_time - start_time
 
         # Track memory after render
-        mem_after = process.memory_info().rss / 1024 / 1024  # MB
+        mem_after = _SELF.memory_info().rss / 1024 / 1024  # MB
         mem_used = mem_after - mem_before
 
         logger.info(f"Render completed in {duration:.2f} seconds")
@@ -198,13 +315,9 @@ def execute_render(scene_script: str, output_path: str) -> Dict[str, Any]:
         try:
             _verify_output(output_path)
         except Exception as e:
-            return {
-                "success": False,
-                "output_path": output_path,
-                "duration": duration,
-                "memory_used": mem_used,
-                "error": f"Output verification failed: {str(e)}",
-            }
+            return _fail(
+                output_path, duration, f"Output verification failed: {str(e)}", mem_before
+            )
 
         return {
             "success": True,
@@ -217,14 +330,7 @@ def execute_render(scene_script: str, output_path: str) -> Dict[str, Any]:
     except subprocess.TimeoutExpired:
         error_msg = f"Render timeout after {settings.RENDER_TIMEOUT} seconds"
         logger.error(error_msg)
-        mem_after = process.memory_info().rss / 1024 / 1024
-        return {
-            "success": False,
-            "output_path": output_path,
-            "duration": settings.RENDER_TIMEOUT,
-            "memory_used": mem_after - mem_before,
-            "error": error_msg,
-        }
+        return _fail(output_path, settings.RENDER_TIMEOUT, error_msg, mem_before)
 
     except subprocess.CalledProcessError as e:
         error_msg = f"Blender process failed: {e.stderr}"
@@ -239,41 +345,24 @@ def execute_render(scene_script: str, output_path: str) -> Dict[str, Any]:
         elif "out of memory" in stderr_lower:
             error_msg = "Insufficient RAM for render"
 
-        mem_after = process.memory_info().rss / 1024 / 1024
-        return {
-            "success": False,
-            "output_path": output_path,
-            "duration": 0,
-            "memory_used": mem_after - mem_before,
-            "error": error_msg,
-        }
+        return _fail(output_path, 0, error_msg, mem_before)
 
     except FileNotFoundError:
         error_msg = f"Blender binary not found at {settings.BLENDER_BINARY}"
         logger.error(error_msg)
-        return {
-            "success": False,
-            "output_path": output_path,
-            "duration": 0,
-            "memory_used": 0,
-            "error": error_msg,
-        }
+        return _fail(output_path, 0, error_msg, mem_before)
 
     except OSError as e:
         error_msg = f"System error during render: {str(e)}"
         logger.error(error_msg)
-        mem_after = process.memory_info().rss / 1024 / 1024
-        return {
-            "success": False,
-            "output_path": output_path,
-            "duration": 0,
-            "memory_used": mem_after - mem_before,
-            "error": error_msg,
-        }
+        return _fail(output_path, 0, error_msg, mem_before)
 
     finally:
-        # Always cleanup temporary script file
-        if script_path.exists():
+        # Always cleanup the script source (close the memfd or unlink
+        # the temporary file)
+        if script_fd is not None:
+            os.close(script_fd)
+        elif script_path is not None:
             script_path.unlink(missing_ok=True)
             logger.debug(f"Cleaned up temporary script: {script_path}")
 
@@ -379,3 +468,110 @@ def execute_preset_render(
             "error": error_msg,
             "preset": preset_name,
         }
+
+
+def execute_render_batch(jobs: list) -> list:
+    """
+    Render multiple preset jobs in a single Blender invocation.
+
+    Amortizes Blender's startup cost (bpy import, Cycles/GPU init)
+    across N renders by generating one wrapper script that resets the
+    scene between jobs and reports per-job results via stdout markers.
+
+    Args:
+        jobs: List of dicts with asset_path, preset, output_path keys
+
+    Returns:
+        list: One result dict per job, same shape as execute_preset_render
+    """
+    results = []
+    scripts = []
+    for job in jobs:
+        try:
+            scripts.append(
+                generate_preset_scene(
+                    job["asset_path"], job["preset"], job["output_path"]
+                )
+            )
+        except Exception as e:
+            scripts.append(None)
+            logger.error(f"Scene generation failed for batch job: {e}")
+
+    # Wrapper: per-job factory reset + exec + structured result marker
+    runnable = [(idx, s) for idx, s in enumerate(scripts) if s is not None]
+    wrapper = (
+        "import bpy, json, traceback\n"
+        f"_jobs = {[(idx, s) for idx, s in runnable]!r}\n"
+        "for _idx, _src in _jobs:\n"
+        "    try:\n"
+        "        bpy.ops.wm.read_factory_settings(use_empty=True)\n"
+        "        exec(compile(_src, f'batch_job_{_idx}', 'exec'), {'__name__': '__main__'})\n"
+        "        _result = {'index': _idx, 'success': True, 'error': None}\n"
+        "    except Exception as _e:\n"
+        "        _result = {'index': _idx, 'success': False, 'error': str(_e)}\n"
+        "    print('AIDP_JOB_RESULT:' + json.dumps(_result), flush=True)\n"
+    )
+
+    batch_outcome: dict = {}
+    error_msg = None
+    duration = 0.0
+    if runnable:
+        # The wrapper embeds every scene script, so pass it as a file
+        # (not argv) to stay clear of ARG_MAX for large batches
+        wrapper_path = Path("/tmp") / f"render_batch_{uuid.uuid4()}.py"
+        wrapper_path.write_text(wrapper)
+
+        start_time = time.time()
+        try:
+            completed = subprocess.run(
+                [
+                    settings.BLENDER_BINARY,
+                    "--background",
+                    "--python",
+                    str(wrapper_path),
+                ],
+                capture_output=True,
+                text=True,
+                timeout=settings.RENDER_TIMEOUT * max(1, len(runnable)),
+            )
+            for line in completed.stdout.splitlines():
+                if line.startswith("AIDP_JOB_RESULT:"):
+                    parsed = json.loads(line[len("AIDP_JOB_RESULT:"):])
+                    batch_outcome[parsed["index"]] = parsed
+        except subprocess.TimeoutExpired:
+            error_msg = f"Batch render timeout after {settings.RENDER_TIMEOUT * len(runnable)} seconds"
+            logger.error(error_msg)
+        except (FileNotFoundError, OSError) as e:
+            error_msg = f"Blender batch execution failed: {e}"
+            logger.error(error_msg)
+        finally:
+            wrapper_path.unlink(missing_ok=True)
+        duration = time.time() - start_time
+
+    for idx, job in enumerate(jobs):
+        outcome = batch_outcome.get(idx)
+        if scripts[idx] is None:
+            error = "Scene generation failed"
+        elif outcome is None:
+            error = error_msg or "No result reported by Blender"
+        elif not outcome["success"]:
+            error = outcome["error"]
+        else:
+            error = None
+            try:
+                _verify_output(job["output_path"])
+            except Exception as e:
+                error = f"Output verification failed: {str(e)}"
+
+        results.append(
+            {
+                "success": error is None,
+                "output_path": job["output_path"],
+                "duration": duration / max(1, len(runnable)),
+                "memory_used": 0,
+                "error": error,
+                "preset": job["preset"],
+            }
+        )
+
+    return results
@@ -3,37 +3,69 @@ Preset loader for scene rendering configurations.
 
 This module loads scene presets from presets.yaml and provides
 functions to retrieve and validate preset configurations.
+
+The parsed file is cached at module level keyed by name and only
+re-read when the YAML's mtime changes, so steady-state lookups are a
+dict read instead of file I/O plus a YAML parse.
 """
 
 import yaml
 from pathlib import Path
 from typing import Any
 
+_PRESET_FILE = Path(__file__).parent / "presets.yaml"
 
-def list_available_presets() -> list[str]:
-    """
-    Returns list of available preset names.
+# libyaml's C loader parses ~10x faster when the extension is available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-    Returns:
-        List of preset names (e.g., ["studio", "sunset", "dramatic"])
+_preset_cache: dict[str, dict[str, Any]] | None = None
+_preset_mtime: int = 0
+
+
+def _ensure_loaded() -> dict[str, dict[str, Any]]:
+    """Load (or reload on mtime change) the preset cache.
+
+    Raises:
+        FileNotFoundError: If presets.yaml doesn't exist
+        ValueError: If the YAML is malformed or missing the presets key
     """
-    preset_file = Path(__file__).parent / "presets.yaml"
+    global _preset_cache, _preset_mtime
 
-    if not preset_file.exists():
+    try:
+        mtime = _PRESET_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(
-            f"presets.yaml not found. Ensure file exists at {preset_file}"
+            f"presets.yaml not found. Ensure file exists at {_PRESET_FILE}"
         )
 
-    try:
-        with open(preset_file) as f:
-            data = yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        raise ValueError(f"Invalid YAML format in presets.yaml: {e}")
+    if _preset_cache is None or mtime != _preset_mtime:
+        try:
+            with open(_PRESET_FILE) as f:
+                data = yaml.load(f, Loader=_YAML_LOADER)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML format in presets.yaml: {e}")
 
-    if not data or "presets" not in data:
-        raise ValueError("presets.yaml must contain a 'presets' key")
+        if not data or "presets" not in data:
+            raise ValueError("presets.yaml must contain a 'presets' key")
 
-    return [preset["name"] for preset in data["presets"]]
+        _preset_cache = {
+            preset["name"]: preset
+            for preset in data["presets"]
+            if isinstance(preset, dict) and "name" in preset
+        }
+        _preset_mtime = mtime
+
+    return _preset_cache
+
+
+def list_available_presets() -> list[str]:
+    """
+    Returns list of available preset names.
+
+    Returns:
+        List of preset names (e.g., ["studio", "sunset", "dramatic"])
+    """
+    return list(_ensure_loaded().keys())
 
 
 def load_preset(preset_name: str) -> dict[str, Any]:
@@ -54,30 +86,13 @@ def load_preset(preset_name: str) -> dict[str, Any]:
     if not preset_name or not isinstance(preset_name, str):
         raise ValueError("preset_name must be a non-empty string")
 
-    preset_file = Path(__file__).parent / "presets.yaml"
-
-    if not preset_file.exists():
-        raise FileNotFoundError(
-            f"presets.yaml not found. Ensure file exists at {preset_file}"
-        )
+    presets = _ensure_loaded()
 
-    # Load and parse YAML
     try:
-        with open(preset_file) as f:
-            data = yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        raise ValueError(f"Invalid YAML format in presets.yaml: {e}")
-
-    if not data or "presets" not in data:
-        raise ValueError("presets.yaml must contain a 'presets' key")
-
-    # Search for preset by name
-    for preset in data["presets"]:
-        if preset.get("name") == preset_name:
-            return preset
-
-    # Preset not found - raise error with available options
-    available = list_available_presets()
-    raise ValueError(
-        f"Invalid preset '{preset_name}'. " f"Available presets: {', '.join(available)}"
-    )
+        return presets[preset_name]
+    except KeyError:
+        # Preset not found - raise error with available options
+        raise ValueError(
+            f"Invalid preset '{preset_name}'. "
+            f"Available presets: {', '.join(presets.keys())}"
+        ) from None
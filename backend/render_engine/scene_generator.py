@@ -13,24 +13,9 @@ from .preset_loader import load_preset
 logger = logging.getLogger(__name__)
 
 
-def generate_test_scene(output_path: str) -> str:
-    """
-    Generate Blender Python script for basic test scene.
-
-    Creates a scene with:
-    - Default cube at origin
-    - Camera at (7, -7, 5) looking at origin
-    - Area light at (5, 5, 5)
-    - Cycles render engine with GPU compute
-    - 1024x1024 resolution, 128 samples, PNG output
-
-    Args:
-        output_path: Path where rendered PNG should be saved
-
-    Returns:
-        str: Complete Blender Python script content
-    """
-    script = f"""import bpy
+# Test-scene script template, built once: only the output path varies
+# per call, so the large literal isn't re-assembled per render
+_TEST_SCENE_TEMPLATE = """import bpy
 import mathutils
 
 # Clear default scene
@@ -94,8 +79,26 @@ bpy.ops.render.render(write_still=True)
 print(f"Render complete: {{scene.render.filepath}}")
 """
 
+
+def generate_test_scene(output_path: str) -> str:
+    """
+    Generate Blender Python script for basic test scene.
+
+    Creates a scene with:
+    - Default cube at origin
+    - Camera at (7, -7, 5) looking at origin
+    - Area light at (5, 5, 5)
+    - Cycles render engine with GPU compute
+    - 1024x1024 resolution, 128 samples, PNG output
+
+    Args:
+        output_path: Path where rendered PNG should be saved
+
+    Returns:
+        str: Complete Blender Python script content
+    """
     logger.debug(f"Generated test scene script for output: {output_path}")
-    return script
+    return _TEST_SCENE_TEMPLATE.format(output_path=output_path)
 
 
 def _hex_to_rgb(hex_color: str) -> tuple[float, float, float]:
@@ -128,6 +131,27 @@ def _rgb_to_rgba(rgb: tuple[float, float, float]) -> tuple[float, float, float,
     return (rgb[0], rgb[1], rgb[2], 1.0)
 
 
+# Jinja environment and compiled preset template, built once: template
+# compilation is deterministic and auto_reload=False skips the per-render
+# stat() of the template file
+_env: Environment | None = None
+_template = None
+
+
+def _get_template():
+    global _env, _template
+    if _template is None:
+        _env = Environment(
+            loader=FileSystemLoader(Path(__file__).parent / "templates"),
+            auto_reload=False,
+            cache_size=64,
+        )
+        _env.filters["hex_to_rgb"] = _hex_to_rgb
+        _env.filters["rgb_to_rgba"] = _rgb_to_rgba
+        _template = _env.get_template("preset_scene.py.jinja2")
+    return _template
+
+
 def generate_preset_scene(asset_path: str, preset_name: str, output_path: str) -> str:
     """
     Generate Blender Python script for preset-based scene rendering.
@@ -150,19 +174,8 @@ def generate_preset_scene(asset_path: str, preset_name: str, output_path: str) -
     # Load preset configuration
     preset = load_preset(preset_name)
 
-    # Load Jinja2 template
-    template_dir = Path(__file__).parent / "templates"
-    env = Environment(loader=FileSystemLoader(template_dir))
-
-    # Register custom filters
-    env.filters["hex_to_rgb"] = _hex_to_rgb
-    env.filters["rgb_to_rgba"] = _rgb_to_rgba
-
-    # Get template
-    template = env.get_template("preset_scene.py.jinja2")
-
-    # Render template
-    script = template.render(
+    # Render the module-level compiled template
+    script = _get_template().render(
         asset_path=asset_path, output_path=output_path, preset=preset
     )
 
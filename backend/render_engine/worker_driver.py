@@ -0,0 +1,48 @@
+"""
+Blender-side driver loop for the persistent worker pool.
+
+Run inside Blender (`blender --background --python worker_driver.py`).
+Reads one JSON job per line from stdin, executes the referenced scene
+script against a factory-reset scene, and reports a JSON result line
+prefixed with AIDP_RESULT: on stdout.
+"""
+
+import json
+import sys
+import traceback
+
+import bpy  # noqa: F401  (available inside Blender only)
+
+
+def main() -> None:
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            job = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if job.get("stop"):
+            break
+
+        try:
+            # Reset to an empty scene so jobs can't leak state into
+            # each other across the long-lived process
+            bpy.ops.wm.read_factory_settings(use_empty=True)
+            with open(job["script_path"]) as f:
+                code = f.read()
+            exec(compile(code, job["script_path"], "exec"), {"__name__": "__main__"})
+            result = {"success": True, "error": None}
+        except Exception as e:
+            result = {
+                "success": False,
+                "error": f"{e}\n{traceback.format_exc()}",
+            }
+
+        sys.stdout.write("AIDP_RESULT:" + json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
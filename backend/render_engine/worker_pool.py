@@ -0,0 +1,147 @@
+"""
+Persistent Blender worker pool.
+
+Blender cold-start (bpy import, Cycles/GPU context) costs seconds per
+render when every job forks a fresh process. The pool keeps a small set
+of long-lived `blender --background --python worker_driver.py` processes
+alive and feeds them scene scripts over stdin, amortizing startup cost
+across renders. Enabled via settings.BLENDER_WORKER_POOL.
+"""
+
+import json
+import logging
+import os
+import queue
+import subprocess
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_DRIVER_PATH = Path(__file__).parent / "worker_driver.py"
+
+
+class BlenderWorker:
+    """One long-lived Blender process driven over stdin/stdout."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.process: Optional[subprocess.Popen] = None
+
+    def _ensure_process(self) -> subprocess.Popen:
+        if self.process is None or self.process.poll() is not None:
+            self.process = subprocess.Popen(
+                [
+                    settings.BLENDER_BINARY,
+                    "--background",
+                    "--python",
+                    str(_DRIVER_PATH),
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+            logger.info(f"Started Blender worker pid={self.process.pid}")
+        return self.process
+
+    def render(self, script_path: str, timeout: float) -> Dict[str, Any]:
+        """Run one scene script in this worker. Caller holds self.lock."""
+        proc = self._ensure_process()
+        try:
+            proc.stdin.write(json.dumps({"script_path": script_path}) + "\n")
+            proc.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            self._kill()
+            return {"success": False, "error": f"Worker pipe broken: {e}"}
+
+        # Read until the result marker; Blender chatters on stdout
+        timer = threading.Timer(timeout, self._kill)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                if line.startswith("AIDP_RESULT:"):
+                    return json.loads(line[len("AIDP_RESULT:"):])
+            return {"success": False, "error": "Worker exited before reporting"}
+        finally:
+            timer.cancel()
+
+    def _kill(self) -> None:
+        if self.process is not None:
+            self.process.kill()
+            self.process = None
+
+    def shutdown(self) -> None:
+        """Ask the worker to exit cleanly, killing it if that fails."""
+        proc = self.process
+        if proc is None or proc.poll() is not None:
+            return
+        try:
+            proc.stdin.write(json.dumps({"stop": True}) + "\n")
+            proc.stdin.flush()
+            proc.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            self._kill()
+
+
+class BlenderWorkerPool:
+    """
+    Fixed-size pool of BlenderWorker processes.
+
+    Workers are started lazily on first use and handed out through a
+    queue so concurrent renders never share a process.
+    """
+
+    def __init__(self, size: Optional[int] = None):
+        self.size = size or max(1, min(4, os.cpu_count() or 1))
+        self._workers: queue.Queue = queue.Queue()
+        for _ in range(self.size):
+            self._workers.put(BlenderWorker())
+
+    def render_script(
+        self, scene_script: str, timeout: float
+    ) -> Dict[str, Any]:
+        """
+        Render one scene script on an available worker.
+
+        The script is written to a temp file (the driver reads it by
+        path) and always cleaned up afterwards.
+        """
+        script_path = Path("/tmp") / f"render_script_{uuid.uuid4()}.py"
+        script_path.write_text(scene_script)
+
+        worker = self._workers.get()
+        try:
+            with worker.lock:
+                return worker.render(str(script_path), timeout)
+        finally:
+            self._workers.put(worker)
+            script_path.unlink(missing_ok=True)
+
+    def shutdown(self) -> None:
+        """Shut down all workers (drains the queue)."""
+        for _ in range(self.size):
+            try:
+                worker = self._workers.get_nowait()
+            except queue.Empty:
+                break
+            worker.shutdown()
+
+
+# Pool singleton, created on first use when BLENDER_WORKER_POOL is set
+_pool: Optional[BlenderWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> BlenderWorkerPool:
+    """Return the shared BlenderWorkerPool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = BlenderWorkerPool()
+    return _pool
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Build-time preset cache generator.
+
+Validates every scene preset once and writes the resulting
+PresetListResponse payload to app/data/presets.msgpack, so the server
+skips YAML parsing and Pydantic validation entirely at startup.
+Intended to run during the container build (after COPY, before CMD).
+
+Usage:
+    python backend/scripts/build_preset_cache.py
+"""
+
+import sys
+from pathlib import Path
+
+import msgpack
+
+# Add backend directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.routes.presets import _build_presets, PRESET_CACHE_FILE  # noqa: E402
+
+
+def main() -> int:
+    response = _build_presets()
+    PRESET_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    payload = msgpack.packb(response.model_dump(), use_bin_type=True)
+    PRESET_CACHE_FILE.write_bytes(payload)
+    print(
+        f"Wrote {len(response.presets)} presets "
+        f"({len(payload)} bytes) to {PRESET_CACHE_FILE}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,7 @@ Also copies suzanne.gltf from render_engine/test_assets/
 
 import math
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -56,148 +57,132 @@ def create_cube_geometry():
 
 def create_sphere_geometry(segments=16, rings=12):
     """Create vertices and indices for a UV sphere."""
-    vertices = []
-    indices = []
-
-    for j in range(rings + 1):
-        theta = j * math.pi / rings
-        sin_theta = math.sin(theta)
-        cos_theta = math.cos(theta)
-
-        for i in range(segments + 1):
-            phi = i * 2 * math.pi / segments
-            sin_phi = math.sin(phi)
-            cos_phi = math.cos(phi)
-
-            x = cos_phi * sin_theta
-            y = cos_theta
-            z = sin_phi * sin_theta
-            vertices.append([x, y, z])
-
-    for j in range(rings):
-        for i in range(segments):
-            first = j * (segments + 1) + i
-            second = first + segments + 1
-
-            indices.extend([first, second, first + 1])
-            indices.extend([second, second + 1, first + 1])
+    # Vertices in one broadcast pass: rows sweep theta, columns sweep phi
+    theta = (np.arange(rings + 1) * math.pi / rings)[:, None]
+    phi = (np.arange(segments + 1) * 2 * math.pi / segments)[None, :]
+
+    sin_theta = np.sin(theta)
+    x = np.cos(phi) * sin_theta
+    y = np.broadcast_to(np.cos(theta), x.shape)
+    z = np.sin(phi) * sin_theta
+    vertices = np.stack([x, y, z], axis=-1).reshape(-1, 3)
+
+    # Indices as one broadcast: a (rings, segments, 6) quad array laid
+    # out in the same j-outer/i-inner order as the original loops
+    j = np.arange(rings)[:, None]
+    i = np.arange(segments)[None, :]
+    first = j * (segments + 1) + i
+    second = first + segments + 1
+    quads = np.stack(
+        [first, second, first + 1, second, second + 1, first + 1], axis=-1
+    )
 
-    return np.array(vertices, dtype=np.float32), np.array(indices, dtype=np.uint16)
+    return vertices.astype(np.float32), quads.reshape(-1).astype(np.uint16)
 
 
 def create_cylinder_geometry(segments=16, height=2.0, radius=1.0):
     """Create vertices and indices for a cylinder."""
-    vertices = []
-    indices = []
-
     half_height = height / 2
 
-    # Top center
-    vertices.append([0, half_height, 0])
+    # Ring offsets computed once, reused for both caps
+    angle = np.arange(segments) * 2 * math.pi / segments
+    ring_x = radius * np.cos(angle)
+    ring_z = radius * np.sin(angle)
+
+    def _ring(y: float) -> np.ndarray:
+        ring = np.empty((segments, 3))
+        ring[:, 0] = ring_x
+        ring[:, 1] = y
+        ring[:, 2] = ring_z
+        return ring
+
+    # Layout: top center, top ring, bottom center, bottom ring
+    vertices = np.concatenate(
+        [
+            [[0, half_height, 0]],
+            _ring(half_height),
+            [[0, -half_height, 0]],
+            _ring(-half_height),
+        ]
+    )
     top_center = 0
+    bottom_center = segments + 1
+
+    # Cap and side triangles from broadcast index arithmetic, in the
+    # same top-cap / bottom-cap / sides order as the original loops
+    i = np.arange(segments)
+    next_i = (i + 1) % segments
+    top1 = 1 + i
+    top2 = 1 + next_i
+    bot1 = bottom_center + 1 + i
+    bot2 = bottom_center + 1 + next_i
+
+    center = np.full(segments, top_center)
+    top_cap = np.stack([center, top1, top2], axis=-1)
+    bottom_cap = np.stack([center + bottom_center, bot2, bot1], axis=-1)
+    sides = np.stack([top1, bot1, top2, top2, bot1, bot2], axis=-1)
+
+    indices = np.concatenate(
+        [top_cap.reshape(-1), bottom_cap.reshape(-1), sides.reshape(-1)]
+    )
 
-    # Top ring
-    for i in range(segments):
-        angle = i * 2 * math.pi / segments
-        x = radius * math.cos(angle)
-        z = radius * math.sin(angle)
-        vertices.append([x, half_height, z])
-
-    # Bottom center
-    vertices.append([0, -half_height, 0])
-    bottom_center = len(vertices) - 1
-
-    # Bottom ring
-    for i in range(segments):
-        angle = i * 2 * math.pi / segments
-        x = radius * math.cos(angle)
-        z = radius * math.sin(angle)
-        vertices.append([x, -half_height, z])
-
-    # Top cap triangles
-    for i in range(segments):
-        next_i = (i + 1) % segments
-        indices.extend([top_center, 1 + i, 1 + next_i])
-
-    # Bottom cap triangles
-    for i in range(segments):
-        next_i = (i + 1) % segments
-        indices.extend([bottom_center, bottom_center + 1 + next_i, bottom_center + 1 + i])
-
-    # Side triangles
-    for i in range(segments):
-        next_i = (i + 1) % segments
-        top1 = 1 + i
-        top2 = 1 + next_i
-        bot1 = bottom_center + 1 + i
-        bot2 = bottom_center + 1 + next_i
-        indices.extend([top1, bot1, top2])
-        indices.extend([top2, bot1, bot2])
-
-    return np.array(vertices, dtype=np.float32), np.array(indices, dtype=np.uint16)
+    return vertices.astype(np.float32), indices.astype(np.uint16)
 
 
 def create_torus_geometry(major_segments=24, minor_segments=12, major_radius=1.0, minor_radius=0.4):
     """Create vertices and indices for a torus."""
-    vertices = []
-    indices = []
-
-    for i in range(major_segments):
-        theta = i * 2 * math.pi / major_segments
-        cos_theta = math.cos(theta)
-        sin_theta = math.sin(theta)
-
-        for j in range(minor_segments):
-            phi = j * 2 * math.pi / minor_segments
-            cos_phi = math.cos(phi)
-            sin_phi = math.sin(phi)
+    # Vertices in one broadcast pass: rows sweep theta, columns sweep phi
+    theta = (np.arange(major_segments) * 2 * math.pi / major_segments)[:, None]
+    phi = (np.arange(minor_segments) * 2 * math.pi / minor_segments)[None, :]
 
-            x = (major_radius + minor_radius * cos_phi) * cos_theta
-            y = minor_radius * sin_phi
-            z = (major_radius + minor_radius * cos_phi) * sin_theta
-            vertices.append([x, y, z])
+    tube = major_radius + minor_radius * np.cos(phi)
+    x = tube * np.cos(theta)
+    y = np.broadcast_to(minor_radius * np.sin(phi), x.shape)
+    z = tube * np.sin(theta)
+    vertices = np.stack([x, y, z], axis=-1).reshape(-1, 3)
 
-    for i in range(major_segments):
-        next_i = (i + 1) % major_segments
-        for j in range(minor_segments):
-            next_j = (j + 1) % minor_segments
+    # Indices with modular wrap-around on both rings, matching the
+    # i-outer/j-inner order of the original loops
+    i = np.arange(major_segments)[:, None]
+    next_i = (i + 1) % major_segments
+    j = np.arange(minor_segments)[None, :]
+    next_j = (j + 1) % minor_segments
 
-            v0 = i * minor_segments + j
-            v1 = i * minor_segments + next_j
-            v2 = next_i * minor_segments + next_j
-            v3 = next_i * minor_segments + j
+    v0 = i * minor_segments + j
+    v1 = i * minor_segments + next_j
+    v2 = next_i * minor_segments + next_j
+    v3 = next_i * minor_segments + j
+    quads = np.stack([v0, v3, v1, v1, v3, v2], axis=-1)
 
-            indices.extend([v0, v3, v1])
-            indices.extend([v1, v3, v2])
-
-    return np.array(vertices, dtype=np.float32), np.array(indices, dtype=np.uint16)
+    return vertices.astype(np.float32), quads.reshape(-1).astype(np.uint16)
 
 
 def create_gltf_file(output_path: Path, vertices: np.ndarray, indices: np.ndarray, color: list):
     """Create a .gltf file with given geometry."""
-    vertices_binary = vertices.tobytes()
-    indices_binary = indices.tobytes()
-    binary_blob = vertices_binary + indices_binary
+    # Sizes come straight from the arrays; the .bin is written as two
+    # buffer-protocol writes, so no concatenated blob is ever allocated
+    vertices_nbytes = vertices.nbytes
+    indices_nbytes = indices.nbytes
 
     gltf = GLTF2()
 
     # Buffer
     buffer = Buffer()
-    buffer.byteLength = len(binary_blob)
+    buffer.byteLength = vertices_nbytes + indices_nbytes
     gltf.buffers.append(buffer)
 
     # BufferViews
     vertices_bv = BufferView()
     vertices_bv.buffer = 0
     vertices_bv.byteOffset = 0
-    vertices_bv.byteLength = len(vertices_binary)
+    vertices_bv.byteLength = vertices_nbytes
     vertices_bv.target = 34962
     gltf.bufferViews.append(vertices_bv)
 
     indices_bv = BufferView()
     indices_bv.buffer = 0
-    indices_bv.byteOffset = len(vertices_binary)
-    indices_bv.byteLength = len(indices_binary)
+    indices_bv.byteOffset = vertices_nbytes
+    indices_bv.byteLength = indices_nbytes
     indices_bv.target = 34963
     gltf.bufferViews.append(indices_bv)
 
@@ -254,7 +239,8 @@ def create_gltf_file(output_path: Path, vertices: np.ndarray, indices: np.ndarra
     bin_path = output_path.with_suffix(".bin")
 
     with open(bin_path, "wb") as f:
-        f.write(binary_blob)
+        f.write(memoryview(vertices))
+        f.write(memoryview(indices))
 
     gltf.buffers[0].uri = bin_path.name
     gltf.save(str(output_path))
@@ -263,6 +249,23 @@ def create_gltf_file(output_path: Path, vertices: np.ndarray, indices: np.ndarra
     print(f"Created {output_path.name}: {total_size} bytes")
 
 
+# Geometry builder per asset name (module-level so workers can import it)
+_GEOMETRY_BUILDERS = {
+    "cube": create_cube_geometry,
+    "sphere": create_sphere_geometry,
+    "cylinder": create_cylinder_geometry,
+    "torus": create_torus_geometry,
+}
+
+
+def _build_asset(args: tuple) -> str:
+    """Build one asset (geometry + glTF files). Runs in a worker process."""
+    name, color, out_dir = args
+    vertices, indices = _GEOMETRY_BUILDERS[name]()
+    create_gltf_file(Path(out_dir) / f"{name}.gltf", vertices, indices, color)
+    return name
+
+
 def main():
     """Generate all test assets."""
     project_root = Path(__file__).parent.parent.parent
@@ -277,21 +280,10 @@ def main():
         "torus": [0.8, 0.8, 0.2, 1.0],     # Yellow
     }
 
-    # Generate cube
-    vertices, indices = create_cube_geometry()
-    create_gltf_file(test_assets_dir / "cube.gltf", vertices, indices, colors["cube"])
-
-    # Generate sphere
-    vertices, indices = create_sphere_geometry()
-    create_gltf_file(test_assets_dir / "sphere.gltf", vertices, indices, colors["sphere"])
-
-    # Generate cylinder
-    vertices, indices = create_cylinder_geometry()
-    create_gltf_file(test_assets_dir / "cylinder.gltf", vertices, indices, colors["cylinder"])
-
-    # Generate torus
-    vertices, indices = create_torus_geometry()
-    create_gltf_file(test_assets_dir / "torus.gltf", vertices, indices, colors["torus"])
+    # The four shapes are independent: build them across cores
+    jobs = [(name, color, str(test_assets_dir)) for name, color in colors.items()]
+    with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+        list(executor.map(_build_asset, jobs))
 
     # Copy suzanne from render_engine/test_assets
     suzanne_src = project_root / "backend" / "render_engine" / "test_assets" / "suzanne.gltf"
@@ -25,10 +25,10 @@ TEST_ASSETS_DIR = Path(__file__).parent.parent.parent.parent / "test-assets"
 def reset_state():
     """Reset provider singleton and rate limiter before each test."""
     reset_provider()
-    upload_rate_limiter.requests.clear()
+    upload_rate_limiter.buckets.clear()
     yield
     reset_provider()
-    upload_rate_limiter.requests.clear()
+    upload_rate_limiter.buckets.clear()
 
 
 @pytest.fixture
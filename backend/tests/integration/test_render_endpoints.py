@@ -24,10 +24,10 @@ client = TestClient(app)
 def reset_state():
     """Reset provider singleton and rate limiter before each test."""
     reset_provider()
-    upload_rate_limiter.requests.clear()
+    upload_rate_limiter.buckets.clear()
     yield
     reset_provider()
-    upload_rate_limiter.requests.clear()
+    upload_rate_limiter.buckets.clear()
 
 
 @pytest.fixture
@@ -20,9 +20,9 @@ client = TestClient(app)
 @pytest.fixture(autouse=True)
 def reset_rate_limiter():
     """Reset rate limiter before each test."""
-    upload_rate_limiter.requests.clear()
+    upload_rate_limiter.buckets.clear()
     yield
-    upload_rate_limiter.requests.clear()
+    upload_rate_limiter.buckets.clear()
 
 
 @pytest.fixture
@@ -27,3 +27,17 @@ def test_docs_accessible(client):
     """Test that API documentation is accessible"""
     response = client.get("/docs")
     assert response.status_code == 200
+
+
+def test_middleware_registered_once():
+    """Each middleware appears exactly once in the ASGI stack.
+
+    Guards against duplicate app definitions re-registering middleware,
+    which would double the stack depth per request.
+    """
+    from app.main import app
+
+    middleware_names = [m.cls.__name__ for m in app.user_middleware]
+    assert len(middleware_names) == len(set(middleware_names))
+    assert middleware_names.count("CoreMiddleware") == 1
+    assert middleware_names.count("BodySizeLimitMiddleware") == 1
@@ -136,6 +136,82 @@ class TestCleanupOldFiles:
         assert result["folders_deleted"] == 0
 
 
+class TestIndexSweep:
+    """Tests for the job-index fast path of cleanup_old_files."""
+
+    @pytest.fixture
+    def indexed_dirs(self, temp_cleanup_dirs):
+        """Patch cleanup to use temp dirs with an index under jobs/."""
+        dirs = [
+            str(temp_cleanup_dirs["uploads"]),
+            str(temp_cleanup_dirs["outputs"]),
+            str(temp_cleanup_dirs["jobs"]),
+        ]
+        index_path = str(temp_cleanup_dirs["jobs"] / "_index")
+        with patch("app.services.cleanup_scheduler.CLEANUP_DIRECTORIES", dirs), patch(
+            "app.services.cleanup_scheduler.JOB_INDEX_PATH", index_path
+        ):
+            yield {**temp_cleanup_dirs, "index": Path(index_path)}
+
+    @staticmethod
+    def _make_job_folders(dirs: dict, job_id: str, age_hours: float = 0) -> None:
+        for key in ("uploads", "outputs", "jobs"):
+            folder = dirs[key] / job_id
+            folder.mkdir()
+            if age_hours:
+                old = time.time() - age_hours * 3600
+                os.utime(folder, (old, old))
+
+    @pytest.mark.asyncio
+    async def test_index_sweep_deletes_expired_jobs(self, indexed_dirs):
+        """Indexed expired jobs are deleted across all trees."""
+        self._make_job_folders(indexed_dirs, "old-job")
+        self._make_job_folders(indexed_dirs, "new-job")
+        indexed_dirs["index"].write_text(
+            f"old-job\t{time.time() - 48 * 3600}\n"
+            f"new-job\t{time.time()}\n"
+        )
+
+        # Force the index-only path (no safety-net scan this sweep)
+        with patch("app.services.cleanup_scheduler._sweep_counter", 1):
+            result = await cleanup_old_files()
+
+        assert result["folders_deleted"] == 3
+        assert not (indexed_dirs["uploads"] / "old-job").exists()
+        assert not (indexed_dirs["jobs"] / "old-job").exists()
+        assert (indexed_dirs["uploads"] / "new-job").exists()
+        # Surviving entry stays in the index, expired one is gone
+        index_content = indexed_dirs["index"].read_text()
+        assert "new-job" in index_content
+        assert "old-job" not in index_content
+
+    @pytest.mark.asyncio
+    async def test_unindexed_folder_reaped_by_safety_scan(self, indexed_dirs):
+        """Expired folders the index never saw fall to the periodic scan."""
+        self._make_job_folders(indexed_dirs, "orphan-job", age_hours=48)
+        indexed_dirs["index"].write_text(f"live-job\t{time.time()}\n")
+
+        # Counter at 0: the full scan runs alongside the index sweep
+        with patch("app.services.cleanup_scheduler._sweep_counter", 0):
+            result = await cleanup_old_files()
+
+        assert result["folders_deleted"] == 3
+        assert not (indexed_dirs["uploads"] / "orphan-job").exists()
+        assert "live-job" in indexed_dirs["index"].read_text()
+
+    @pytest.mark.asyncio
+    async def test_index_only_sweep_skips_unindexed_folders(self, indexed_dirs):
+        """Between safety scans, only indexed jobs are touched."""
+        self._make_job_folders(indexed_dirs, "orphan-job", age_hours=48)
+        indexed_dirs["index"].write_text("")
+
+        with patch("app.services.cleanup_scheduler._sweep_counter", 1):
+            result = await cleanup_old_files()
+
+        assert result["folders_deleted"] == 0
+        assert (indexed_dirs["uploads"] / "orphan-job").exists()
+
+
 class TestSchedulerLifecycle:
     """Tests for scheduler start/stop functions."""
 
@@ -59,14 +59,15 @@ async def test_save_upload_creates_directory_and_file(temp_storage, mock_upload_
     assert expected_path.stat().st_mode & 0o777 == 0o644
 
 
-def test_create_job_metadata_generates_correct_structure(temp_storage):
+@pytest.mark.asyncio
+async def test_create_job_metadata_generates_correct_structure(temp_storage):
     """Test that create_job_metadata generates correct JSON structure."""
     job_id = "test-job-456"
     filename = "dragon.gltf"
     file_size = 2457600
 
     # Create metadata
-    metadata_path = temp_storage.create_job_metadata(job_id, filename, file_size)
+    metadata_path = await temp_storage.create_job_metadata(job_id, filename, file_size)
 
     # Verify path is correct
     expected_path = Path(temp_storage.jobs_path) / job_id / "metadata.json"
@@ -101,18 +102,20 @@ def test_create_job_metadata_generates_correct_structure(temp_storage):
     assert isinstance(parsed_time, datetime)
 
 
-def test_get_job_metadata_returns_none_for_missing_job(temp_storage):
+@pytest.mark.asyncio
+async def test_get_job_metadata_returns_none_for_missing_job(temp_storage):
     """Test that get_job_metadata returns None for non-existent job."""
     job_id = "non-existent-job"
 
     # Try to get metadata for non-existent job
-    metadata = temp_storage.get_job_metadata(job_id)
+    metadata = await temp_storage.get_job_metadata(job_id)
 
     # Should return None
     assert metadata is None
 
 
-def test_get_job_metadata_loads_existing_metadata(temp_storage):
+@pytest.mark.asyncio
+async def test_get_job_metadata_loads_existing_metadata(temp_storage):
     """Test that get_job_metadata correctly loads existing metadata."""
     job_id = "test-job-789"
 
@@ -133,7 +136,7 @@ def test_get_job_metadata_loads_existing_metadata(temp_storage):
         json.dump(test_metadata, f)
 
     # Load metadata
-    loaded_metadata = temp_storage.get_job_metadata(job_id)
+    loaded_metadata = await temp_storage.get_job_metadata(job_id)
 
     # Verify metadata was loaded correctly
     assert loaded_metadata is not None